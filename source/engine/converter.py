@@ -18,7 +18,9 @@ warnings.filterwarnings("ignore", category=UserWarning, module="whisper.timing")
 warnings.filterwarnings("ignore", message="Failed to launch Triton kernels")
 warnings.filterwarnings("ignore", message=".*DTW implementation.*")
 
-import ffmpeg
+import functools
+import importlib.util
+import io
 import subprocess
 import threading
 import time
@@ -26,20 +28,332 @@ import re
 import tempfile
 import shutil
 import json
+import logging
+import logging.handlers
+import struct
 from pathlib import Path
-from typing import List, Tuple, Optional
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from typing import Dict, List, Tuple, Optional
 
-# Whisper and AI dependencies
-try:
-    import whisper
-    import torch
-    import torchaudio
-    import numpy as np
-    import soundfile as sf
-    WHISPER_AVAILABLE = True
-except ImportError as e:
-    WHISPER_AVAILABLE = False
-    # Note: Error details will be shown when actually needed
+# Whisper and AI dependencies: only checked for here and imported on first use
+# (see _import_whisper), so audio-only runs and their worker processes do not
+# pay the seconds-long torch import
+WHISPER_AVAILABLE = all(importlib.util.find_spec(name) is not None
+                        for name in ('whisper', 'torch', 'torchaudio', 'numpy', 'soundfile'))
+
+# Optional CTranslate2 backend, used instead of openai-whisper when installed
+FASTER_WHISPER_AVAILABLE = importlib.util.find_spec('faster_whisper') is not None
+
+# Optional PyAV (libav bindings) for encoding MP3 in-process, see AudioConverter(backend='pyav')
+PYAV_AVAILABLE = importlib.util.find_spec('av') is not None
+
+
+def _import_whisper() -> bool:
+    """Import the Whisper/torch stack into the module namespace
+    
+    A broken install (missing DLL, ABI mismatch) fails here rather than at
+    find_spec time; it is reported once and then treated as Whisper not being
+    installed. Cheap after the first call.
+    
+    Returns:
+        bool: Whether Whisper can be used
+    """
+    global WHISPER_AVAILABLE, FASTER_WHISPER_AVAILABLE
+    global whisper, torch, torchaudio, np, sf
+    global WhisperModel, BatchedInferencePipeline, decode_audio
+    if not WHISPER_AVAILABLE:
+        return False
+    try:
+        import whisper
+        import torch
+        import torchaudio
+        import numpy as np
+        import soundfile as sf
+    except (ImportError, OSError) as e:
+        print(f"⚠️ Whisper is installed but could not be loaded: {e}")
+        WHISPER_AVAILABLE = False
+        return False
+    if FASTER_WHISPER_AVAILABLE:
+        try:
+            from faster_whisper import WhisperModel, BatchedInferencePipeline, decode_audio
+        except (ImportError, OSError) as e:
+            print(f"⚠️ faster-whisper could not be loaded, using openai-whisper: {e}")
+            FASTER_WHISPER_AVAILABLE = False
+    return True
+
+
+# Resolve the FFmpeg binaries once instead of on every subprocess launch
+_FFMPEG = shutil.which('ffmpeg') or 'ffmpeg'
+_FFPROBE = shutil.which('ffprobe') or 'ffprobe'
+
+# Shallow input probing: the audio stream parameters are in the MP4 header, so the
+# default multi-megabyte stream analysis is not needed. Progress-tracked runs retry
+# without these options if a container needs the full analysis.
+_FAST_INPUT_ARGS = ['-probesize', '32k', '-analyzeduration', '0']
+
+# Output options for regular files: no flush after every packet, so the muxer
+# hands the OS large sequential writes
+_FILE_OUTPUT_ARGS = ['-flush_packets', '0']
+
+# Keep console windows from flashing up for helper processes on Windows
+_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+# Machine-readable progress on stdout. Info level (without banner and stats line)
+# keeps the input's "Duration:" header, so no separate ffprobe call is needed.
+_PROGRESS_ARGS = ['-progress', 'pipe:1', '-hide_banner', '-nostats', '-v', 'info']
+
+# Input duration from FFmpeg's header line, e.g. "  Duration: 00:03:25.46, start: ..."
+_DURATION_RE = re.compile(rb'Duration: (\d+):(\d+):(\d+\.\d+)')
+
+# Containers whose duration _mp4_duration can read without ffprobe
+_MP4_EXTENSIONS = ('.mp4', '.m4a', '.mov')
+
+# Audio inputs picked up by find_audio_files
+_AUDIO_EXTENSIONS = ('.m4a', '.mp3', '.wav')
+
+# Full-width progress bar pieces, sliced per redraw instead of rebuilt
+_BAR_FULL = '█' * 30
+_BAR_EMPTY = '░' * 30
+
+# Prompt contamination Whisper echoes back into transcripts
+_PROMPT_PHRASES = [
+    "한국어 음성을 정확하게 인식해주세요.",
+    "안녕하세요.",
+    "한국어 음성을 정확하게 인식해주세요",
+    "안녕하세요"
+]
+
+# Common subtitle hallucinations
+_SUBTITLE_HALLUCINATIONS = [
+    "자막제공자",
+    "자막 제공자",
+    "자막제공", 
+    "자막 제공",
+    "구독",
+    "좋아요",
+    "알림",
+    "구독과 좋아요",
+    "시청해주셔서 감사합니다",
+    "채널 구독",
+    "Subscribe",
+    "Like"
+]
+
+# All unwanted phrases in one pass, longest first so a phrase wins over its prefix
+_UNWANTED_RE = re.compile('|'.join(
+    map(re.escape, sorted(_PROMPT_PHRASES + _SUBTITLE_HALLUCINATIONS, key=len, reverse=True))))
+_WS_RE = re.compile(r'\s+')
+
+# Inputs shorter than this (seconds, when known up front) are converted without
+# progress monitoring; they finish in well under a second
+SHORT_INPUT_SECONDS = 60.0
+
+# Minimum seconds between progress bar redraws
+PROGRESS_REDRAW_INTERVAL = 0.25
+
+# Concurrent ffprobe processes when probing a batch of inputs
+PROBE_WORKERS = 8
+
+# Workflows that end with a Whisper transcription
+TEXT_WORKFLOWS = ("text-only", "audio-and-text", "m4a-mp3-and-text")
+
+# Status log of the batch workflow. Pool workers forward it through a queue to a
+# single writer in the parent (see _init_worker); shared with main.py.
+logger = logging.getLogger('mp4conv')
+
+# Set in worker processes of a parallel batch run (see _init_worker)
+_worker_force = False
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_encoders() -> frozenset:
+    """Names of the encoders FFmpeg was built with (probed once per process)"""
+    try:
+        result = subprocess.run([_FFMPEG, '-nostdin', '-hide_banner', '-encoders'],
+                                capture_output=True, text=True, timeout=10,
+                                encoding='utf-8', errors='replace')
+        return frozenset(parts[1] for parts in map(str.split, result.stdout.splitlines())
+                         if len(parts) > 1)
+    except Exception:
+        return frozenset()
+
+
+@functools.lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    """Whether Whisper can run on a CUDA GPU (probed once per process)"""
+    return _import_whisper() and torch.cuda.is_available()
+
+
+def _ffprobe_entry(input_file: str, entry: str, select_streams: str = None) -> str:
+    """
+    Query a single value with ffprobe, printed as a bare string (no JSON)
+    
+    Args:
+        input_file (str): Path to the media file
+        entry (str): ffprobe -show_entries selector, e.g. 'format=duration'
+        select_streams (str, optional): Stream specifier, e.g. 'a:0'
+    
+    Returns:
+        str: The first value printed by ffprobe ('' if there is none)
+    
+    Raises:
+        subprocess.CalledProcessError: If ffprobe fails
+        subprocess.TimeoutExpired: If ffprobe does not answer within 10 seconds
+    """
+    cmd = [_FFPROBE, '-v', 'error']
+    if select_streams:
+        cmd += ['-select_streams', select_streams]
+    cmd += ['-show_entries', entry, '-of', 'default=nw=1:nk=1', input_file]
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=10, check=True,
+                            encoding='utf-8', errors='replace', creationflags=_NO_WINDOW)
+    values = result.stdout.split()
+    return values[0] if values else ''
+
+
+def _mp4_duration(path: str) -> float:
+    """
+    Read the duration of an MP4/MOV file from its moov/mvhd box
+    
+    Walks the top-level boxes to moov (usually at the start of the file for
+    -movflags +faststart outputs) and reads mvhd's timescale and duration.
+    
+    Args:
+        path (str): Path to the MP4/M4A/MOV file
+    
+    Returns:
+        float: Duration in seconds
+    
+    Raises:
+        ValueError: If the file has no usable mvhd box
+    """
+    with open(path, 'rb') as f:
+        end = os.fstat(f.fileno()).st_size
+        offset = 0
+        while offset + 8 <= end:
+            f.seek(offset)
+            size, box_type = struct.unpack('>I4s', f.read(8))
+            header_size = 8
+            if size == 1:  # 64-bit box size follows the type
+                size = struct.unpack('>Q', f.read(8))[0]
+                header_size = 16
+            elif size == 0:  # Box extends to the end of its container
+                size = end - offset
+            if size < header_size:
+                break
+            
+            if box_type == b'moov':
+                # Descend: only moov's children are walked from here on
+                end = offset + size
+                offset += header_size
+                continue
+            
+            if box_type == b'mvhd':
+                # Version/flags, creation and modification times, timescale and
+                # duration: 20 bytes in version 0, 32 in version 1
+                data = f.read(min(32, size - header_size))
+                if not data or len(data) < (32 if data[0] == 1 else 20):
+                    break  # Truncated box, let the caller fall back to ffprobe
+                if data[0] == 1:  # Version 1: 64-bit times and duration
+                    timescale, duration = struct.unpack('>IQ', data[20:32])
+                else:
+                    timescale, duration = struct.unpack('>II', data[12:20])
+                if timescale and duration:
+                    return duration / timescale
+                break
+            
+            offset += size
+    
+    raise ValueError(f"No usable mvhd box in {path}")
+
+
+def _without_fast_input_args(cmd: list) -> list:
+    """Return a copy of an FFmpeg command with _FAST_INPUT_ARGS removed"""
+    index = cmd.index(_FAST_INPUT_ARGS[0])
+    return cmd[:index] + cmd[index + len(_FAST_INPUT_ARGS):]
+
+
+def _without_progress_args(cmd: list) -> list:
+    """Return a copy of an FFmpeg command with _PROGRESS_ARGS replaced by quiet logging"""
+    index = cmd.index(_PROGRESS_ARGS[0])
+    return cmd[:index] + ['-nostats', '-v', 'error'] + cmd[index + len(_PROGRESS_ARGS):]
+
+
+@functools.lru_cache(maxsize=128)
+def _probe_duration(path: str, mtime_ns: int, size: int) -> float:
+    """
+    Probe a media file's duration in seconds (cached per path, mtime and size)
+    
+    mtime_ns and size only key the cache, so a rewritten file is probed again.
+    Returns 0 if the duration cannot be determined.
+    """
+    # MP4/MOV files carry the duration in their mvhd box, no ffprobe process needed
+    if path.lower().endswith(_MP4_EXTENSIONS):
+        try:
+            return _mp4_duration(path)
+        except (OSError, ValueError, struct.error):
+            pass
+    
+    try:
+        # The audio stream's duration is what gets encoded
+        return float(_ffprobe_entry(path, 'stream=duration', 'a:0'))
+    except Exception:
+        # Fallback: container duration (some formats have no per-stream duration)
+        try:
+            return float(_ffprobe_entry(path, 'format=duration'))
+        except Exception:
+            return 0
+
+
+@functools.lru_cache(maxsize=1024)
+def _probe_codec(path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """
+    Probe the codec name of a media file's first audio stream (cached per file version)
+    
+    Shared by every AudioConverter in the process, so converters created per file
+    still reuse earlier probes. Returns None if the file cannot be probed.
+    """
+    try:
+        return _ffprobe_entry(path, 'stream=codec_name', 'a:0') or None
+    except Exception:
+        return None
+
+
+def _media_duration(path: str) -> float:
+    """Get a media file's duration in seconds, probing each file version only once"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return 0
+    return _probe_duration(os.path.realpath(path), st.st_mtime_ns, st.st_size)
+
+
+def _up_to_date(src: str, dst: str) -> bool:
+    """Check whether dst exists and is at least as new as src"""
+    try:
+        return os.stat(dst).st_mtime >= os.stat(src).st_mtime
+    except OSError:
+        return False
+
+
+def _partial_path(output_file) -> str:
+    """Name an output is written under until it is complete
+    
+    Outputs are only renamed to their real name after FFmpeg succeeds, so a failed
+    or interrupted run never leaves a truncated file that _up_to_date would take as
+    current. The extension is kept so FFmpeg still picks the muxer from it.
+    """
+    base, ext = os.path.splitext(os.fspath(output_file))
+    return f"{base}.partial{ext}"
+
+
+def _remove_partials(*partial_files):
+    """Delete leftover partial outputs (no-op for ones already renamed)"""
+    for partial_file in partial_files:
+        try:
+            os.unlink(partial_file)
+        except OSError:
+            pass
 
 
 class ProgressTracker:
@@ -50,42 +364,74 @@ class ProgressTracker:
         self.current_time = 0
         self.progress_percentage = 0
         self.is_running = False
+        self._duration_cache = {}  # real path -> duration in seconds
+        self.last_drawn = None  # Last bar state written to the terminal
     
     def get_video_duration(self, input_file: str) -> float:
-        """Get duration of video file in seconds using ffprobe"""
-        try:
-            probe = ffmpeg.probe(input_file)
-            duration = float(probe['streams'][0]['duration'])
-            return duration
-        except:
-            # Fallback method using subprocess
+        """Get duration of video file in seconds using ffprobe (probed once per file)"""
+        key = os.path.realpath(input_file)
+        if key in self._duration_cache:
+            return self._duration_cache[key]
+        
+        duration = _media_duration(input_file)
+        if duration <= 0:
+            return 0
+        
+        self._duration_cache[key] = duration
+        return duration
+    
+    def cached_duration(self, input_file: str) -> float:
+        """Return the duration of a file if known or readable without ffprobe (0 otherwise)"""
+        key = os.path.realpath(input_file)
+        if key not in self._duration_cache and input_file.lower().endswith(_MP4_EXTENSIONS):
             try:
-                cmd = ['ffprobe', '-v', 'quiet', '-show_entries', 'format=duration', 
-                       '-of', 'csv=p=0', input_file]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10,
-                                       encoding='utf-8', errors='replace')
-                return float(result.stdout.strip())
-            except:
+                self._duration_cache[key] = _mp4_duration(input_file)
+            except (OSError, ValueError, struct.error):
                 return 0
-    
-    def parse_progress(self, line: str):
-        """Parse FFmpeg progress output line"""
-        if 'time=' in line:
-            time_match = re.search(r'time=(\d+):(\d+):(\d+\.\d+)', line)
-            if time_match:
-                hours = float(time_match.group(1))
-                minutes = float(time_match.group(2))
-                seconds = float(time_match.group(3))
-                self.current_time = hours * 3600 + minutes * 60 + seconds
+        return self._duration_cache.get(key, 0)
+    
+    def remember_duration(self, input_file: str, duration: float):
+        """Store a duration learned elsewhere (e.g. from FFmpeg's own output)"""
+        if duration > 0:
+            self._duration_cache[os.path.realpath(input_file)] = duration
+    
+    def parse_progress(self, line: bytes):
+        """Parse a raw FFmpeg -progress output line (and the input's Duration header)"""
+        if line.startswith(b'out_time_us='):
+            # Integer microseconds ('N/A' or negative before the first packet)
+            microseconds = line[12:].strip()
+            if microseconds.isdigit():
+                self.current_time = int(microseconds) / 1_000_000
                 
                 if self.duration > 0:
                     self.progress_percentage = min(100, (self.current_time / self.duration) * 100)
+        elif self.duration <= 0 and b'Duration:' in line:
+            duration_match = _DURATION_RE.search(line)
+            if duration_match:
+                hours = float(duration_match.group(1))
+                minutes = float(duration_match.group(2))
+                seconds = float(duration_match.group(3))
+                self.duration = hours * 3600 + minutes * 60 + seconds
     
     def show_progress_bar(self, percentage: float, width: int = 30):
-        """Display a progress bar"""
+        """Display a progress bar (skipped when the visible text would not change)"""
         filled = int(width * percentage / 100)
-        bar = '█' * filled + '░' * (width - filled)
-        print(f'\r[{bar}] {percentage:.1f}%', end='', flush=True)
+        text = f'{filled}:{percentage:.1f}'
+        if text == self.last_drawn:
+            return
+        self.last_drawn = text
+        sys.stdout.write(f'\r{self.progress_bar_text(percentage, width)}')
+        sys.stdout.flush()
+    
+    @staticmethod
+    def progress_bar_text(percentage: float, width: int = 30) -> str:
+        """Render a progress bar line such as "[███░░░] 50.0%" """
+        filled = int(width * percentage / 100)
+        if width <= len(_BAR_FULL):
+            full, empty = _BAR_FULL, _BAR_EMPTY
+        else:
+            full, empty = '█' * width, '░' * width
+        return f'[{full[:filled]}{empty[:width - filled]}] {percentage:.1f}%'
 
 
 class AudioSplitter:
@@ -101,20 +447,8 @@ class AudioSplitter:
         self.temp_dir = None
     
     def get_audio_duration(self, audio_file: str) -> float:
-        """Get duration of audio file in seconds"""
-        try:
-            probe = ffmpeg.probe(audio_file)
-            duration = float(probe['streams'][0]['duration'])
-            return duration
-        except Exception:
-            try:
-                cmd = ['ffprobe', '-v', 'quiet', '-show_entries', 'format=duration', 
-                       '-of', 'csv=p=0', audio_file]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10,
-                                       encoding='utf-8', errors='replace')
-                return float(result.stdout.strip())
-            except Exception:
-                return 0
+        """Get duration of audio file in seconds (shares the per-file probe cache)"""
+        return _media_duration(audio_file)
     
     def calculate_chunk_duration(self, audio_file: str) -> float:
         """Calculate optimal chunk duration to stay under size limit"""
@@ -142,66 +476,58 @@ class AudioSplitter:
         """Split audio file into chunks and return list of chunk paths"""
         input_path = Path(input_file)
         
-        # Create temporary directory for chunks
-        self.temp_dir = tempfile.mkdtemp(prefix="audio_chunks_")
-        
         # Calculate chunk duration
         chunk_duration = self.calculate_chunk_duration(input_file)
         total_duration = self.get_audio_duration(input_file)
         
         if total_duration <= chunk_duration:
-            # No splitting needed, copy original file
-            chunk_file = os.path.join(self.temp_dir, f"chunk_000.{input_path.suffix[1:]}")
-            shutil.copy2(input_file, chunk_file)
-            return [chunk_file]
+            # No splitting needed, transcribe the original file in place
+            return [input_file]
+        
+        # Create temporary directory for chunks
+        self.temp_dir = tempfile.mkdtemp(prefix="audio_chunks_")
         
         print(f"  📂 Splitting audio file into chunks...")
         print(f"  ⏱️ Total duration: {total_duration/60:.1f} minutes")
         print(f"  ✂️ Chunk duration: {chunk_duration/60:.1f} minutes")
         
-        chunk_files = []
-        chunk_index = 0
-        start_time = 0
+        # One FFmpeg process writes every chunk with the segment muxer
+        chunk_pattern = os.path.join(self.temp_dir, f"chunk_%03d{input_path.suffix}")
+        cmd = [
+            _FFMPEG, '-nostdin', '-y',
+            '-i', str(input_path),
+            '-vn', '-sn', '-dn', '-map', '0:a:0',  # First audio track only
+            '-c', 'copy',  # Copy without re-encoding for speed
+            '-f', 'segment',
+            '-segment_time', str(chunk_duration),
+            '-reset_timestamps', '1',  # Each chunk starts at 0 like a standalone file
+            '-v', 'quiet',
+            chunk_pattern
+        ]
         
-        while start_time < total_duration:
-            chunk_file = os.path.join(self.temp_dir, f"chunk_{chunk_index:03d}.{input_path.suffix[1:]}")
-            
-            # Calculate end time for this chunk
+        try:
+            subprocess.run(cmd, check=True)
+        except subprocess.CalledProcessError as e:
+            print(f"    ❌ Failed to split audio file: {e}")
+        
+        chunk_files = sorted(glob.glob(os.path.join(self.temp_dir, f"chunk_*{input_path.suffix}")))
+        for chunk_index in range(len(chunk_files)):
+            start_time = chunk_index * chunk_duration
             end_time = min(start_time + chunk_duration, total_duration)
-            
-            try:
-                # Use FFmpeg to extract chunk
-                cmd = [
-                    'ffmpeg', '-y',
-                    '-i', str(input_path),
-                    '-ss', str(start_time),
-                    '-t', str(end_time - start_time),
-                    '-c', 'copy',  # Copy without re-encoding for speed
-                    '-v', 'quiet',
-                    chunk_file
-                ]
-                
-                subprocess.run(cmd, check=True, encoding='utf-8', errors='replace')
-                chunk_files.append(chunk_file)
-                
-                print(f"    ✅ Chunk {chunk_index + 1}: {start_time/60:.1f}m - {end_time/60:.1f}m")
-                
-                start_time = end_time
-                chunk_index += 1
-                
-            except subprocess.CalledProcessError as e:
-                print(f"    ❌ Failed to create chunk {chunk_index}: {e}")
-                break
+            print(f"    ✅ Chunk {chunk_index + 1}: {start_time/60:.1f}m - {end_time/60:.1f}m")
         
         print(f"  🎵 Created {len(chunk_files)} audio chunks")
         return chunk_files
     
     def cleanup_temp_files(self):
         """Clean up temporary chunk files"""
-        if self.temp_dir and os.path.exists(self.temp_dir):
+        if self.temp_dir:
+            # No separate existence check: a missing directory is simply nothing to do
             try:
                 shutil.rmtree(self.temp_dir)
                 print(f"  🧹 Cleaned up temporary files")
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 print(f"  ⚠️ Warning: Could not clean up temp files: {e}")
 
@@ -209,24 +535,78 @@ class AudioSplitter:
 class WhisperTranscriber:
     """Local Whisper AI transcription with GPU support"""
     
-    def __init__(self, model_name: str = "large-v3", device: str = "auto"):
+    # Precision choices; 'auto' picks int8 on CPU and int8_float16/float16 on CUDA.
+    # openai-whisper only distinguishes float32 from half precision on the GPU.
+    COMPUTE_TYPES = ('auto', 'int8', 'int8_float16', 'float16', 'float32')
+    
+    # Forced-language and anti-hallucination settings for the faster-whisper backend,
+    # matching OPENAI_WHISPER_OPTIONS. The VAD filter stays off:
+    # it can drop the quiet openings no_speech_threshold is tuned to keep.
+    FASTER_WHISPER_OPTIONS = {
+        "task": "transcribe",
+        "beam_size": 1,
+        "temperature": 0.0,
+        "no_speech_threshold": 0.05,
+        "log_prob_threshold": -1.0,
+        "compression_ratio_threshold": 1.8,
+        "suppress_tokens": [-1],
+        "without_timestamps": True,
+        "vad_filter": False,
+    }
+    
+    # Forced-language and anti-hallucination settings for openai-whisper's transcribe(),
+    # built once instead of on every chunk
+    OPENAI_WHISPER_OPTIONS = {
+        "task": "transcribe",
+        "verbose": False,
+        "word_timestamps": False,  # Disabled to prevent Triton warnings
+        # initial_prompt removed to prevent contamination of output
+        "no_speech_threshold": 0.05,  # Very low threshold to catch quiet beginnings
+        "logprob_threshold": -1.0,  # Lower threshold for better accuracy with quiet audio
+        "compression_ratio_threshold": 1.8,  # Lower to reduce hallucinations like "자막제공자"
+        "condition_on_previous_text": False,  # Disable to prevent prompt contamination
+        "temperature": 0.0,  # Deterministic output for consistency
+        "beam_size": 1,  # Disable beam search to avoid some GPU optimization issues
+        "suppress_tokens": [-1],  # Suppress common subtitle tokens
+        "without_timestamps": True,  # Focus on content, not timing precision
+    }
+    
+    # Whisper's input window and sample rate, used to lay out batched windows
+    WINDOW_SECONDS = 30
+    SAMPLE_RATE = 16000
+    
+    # 30-second windows decoded together by the batched faster-whisper pipeline
+    BATCH_SIZE = 8
+    
+    def __init__(self, model_name: str = "large-v3", device: str = "auto", compute_type: str = "auto"):
         """Initialize Whisper transcriber
         
         Args:
             model_name: Whisper model to use (large-v3 recommended for Korean)
             device: Device to use ('auto', 'cuda', 'cpu')
+            compute_type: Precision, one of COMPUTE_TYPES. The CTranslate2 compute type
+                          for faster-whisper; with openai-whisper, 'float32' turns
+                          off FP16 on the GPU.
         """
+        if compute_type not in self.COMPUTE_TYPES:
+            raise ValueError(f"Unknown compute type '{compute_type}', "
+                             f"expected one of: {', '.join(self.COMPUTE_TYPES)}")
+        if not _import_whisper():
+            raise ImportError("Whisper is not available. Install with: pip install openai-whisper torch")
+        
         self.model_name = model_name
         self.model = None
+        self.batched_pipeline = None
+        self._pcm_buffer = bytearray()  # reused by load_pcm from file to file
         self.device = self._setup_device(device)
-        
-        if not WHISPER_AVAILABLE:
-            raise ImportError("Whisper is not available. Install with: pip install openai-whisper torch")
+        # faster-whisper runs the same checkpoints with fused, quantized CTranslate2 kernels
+        self.backend = "faster-whisper" if FASTER_WHISPER_AVAILABLE else "openai-whisper"
+        self.compute_type = self._select_compute_type() if compute_type == "auto" else compute_type
     
     def _setup_device(self, device: str) -> str:
         """Setup optimal device for inference"""
         if device == "auto":
-            if torch.cuda.is_available():
+            if _cuda_available():
                 device = "cuda"
                 gpu_name = torch.cuda.get_device_name(0)
                 gpu_memory = torch.cuda.get_device_properties(0).total_memory / 1024**3
@@ -241,6 +621,15 @@ class WhisperTranscriber:
         
         return device
     
+    def _select_compute_type(self) -> str:
+        """Pick the CTranslate2 compute type for the faster-whisper backend"""
+        if self.device != "cuda":
+            return "int8"
+        # Tensor Cores (compute capability 7.0+) run int8 weights with float16 activations:
+        # half the weight reads of float16 for the bandwidth-bound decoder
+        major, _ = torch.cuda.get_device_capability(0)
+        return "int8_float16" if major >= 7 else "float16"
+    
     def load_model(self):
         """Load Whisper model (downloads if first time)"""
         if self.model is None:
@@ -248,14 +637,25 @@ class WhisperTranscriber:
             print(f"  ℹ️ First run may download ~3GB model file")
             
             try:
-                # Load with optimized settings for Windows/CUDA
-                self.model = whisper.load_model(
-                    self.model_name, 
-                    device=self.device,
-                    download_root=None,  # Use default cache
-                    in_memory=True  # Keep model in memory for better performance
-                )
-                print(f"  ✅ Model loaded successfully on {self.device}")
+                if self.backend == "faster-whisper":
+                    self.model = WhisperModel(
+                        self.model_name,
+                        device=self.device,
+                        compute_type=self.compute_type
+                    )
+                else:
+                    # Load with optimized settings for Windows/CUDA
+                    self.model = whisper.load_model(
+                        self.model_name, 
+                        device=self.device,
+                        download_root=None,  # Use default cache
+                        in_memory=True  # Keep model in memory for better performance
+                    )
+                    # Every encoder call sees the same padded (n_mels, 3000) input,
+                    # so cuDNN's autotuned conv algorithm is picked once and reused
+                    torch.backends.cudnn.benchmark = True
+                    torch.set_float32_matmul_precision('high')
+                print(f"  ✅ Model loaded successfully on {self.device} ({self.backend})")
                 
                 # Note: Removed pre-warming to avoid language detection issues
                 if self.device == "cuda":
@@ -265,38 +665,24 @@ class WhisperTranscriber:
                 print(f"  ❌ Failed to load model: {e}")
                 raise
     
-    def transcribe_chunk(self, audio_file: str, chunk_index: int, start_time: float = 0, language: str = "ko") -> dict:
-        """Transcribe a single audio chunk"""
+    def transcribe_chunk(self, audio_file, chunk_index: int, start_time: float = 0, language: str = "ko") -> dict:
+        """Transcribe a single audio chunk (a file path, or 16 kHz float32 samples as array or tensor)"""
         try:
             print(f"    🎤 Processing chunk {chunk_index + 1}...")
             
-            # Temporarily suppress timing-related warnings during transcription
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", category=UserWarning, module="whisper.timing")
-                warnings.filterwarnings("ignore", message="Failed to launch Triton kernels")
-                warnings.filterwarnings("ignore", message=".*DTW implementation.*")
-                
+            if self.backend == "faster-whisper":
+                result = self._transcribe_faster_whisper(audio_file, language)
+            else:
                 # Transcribe with FORCED Korean language and anti-hallucination settings
-                result = self.model.transcribe(
-                    audio_file,
-                    language=language,  # Use the forced language parameter
-                    task="transcribe",
-                    fp16=torch.cuda.is_available(),  # Use FP16 for GPU acceleration
-                    verbose=False,
-                    # Disable word-level timestamps to avoid Triton kernel warnings
-                    word_timestamps=False,  # Disabled to prevent Triton warnings
-                    # Remove initial_prompt to prevent contamination of output
-                    # initial_prompt removed to prevent contamination
-                    no_speech_threshold=0.05,  # Very low threshold to catch quiet beginnings
-                    logprob_threshold=-1.0,  # Lower threshold for better accuracy with quiet audio
-                    compression_ratio_threshold=1.8,  # Lower to reduce hallucinations like "자막제공자"
-                    condition_on_previous_text=False,  # Disable to prevent prompt contamination
-                    temperature=0.0,  # Deterministic output for consistency
-                    beam_size=1,  # Disable beam search to avoid some GPU optimization issues
-                    # Anti-hallucination settings
-                    suppress_tokens=[-1],  # Suppress common subtitle tokens
-                    without_timestamps=True  # Focus on content, not timing precision
-                )
+                # No autograd bookkeeping: the model is only ever run for inference
+                with torch.inference_mode():
+                    result = self.model.transcribe(
+                        audio_file,
+                        language=language,  # Use the forced language parameter
+                        # FP16 for GPU acceleration unless float32 was asked for
+                        fp16=self.device == "cuda" and self.compute_type != "float32",
+                        **self.OPENAI_WHISPER_OPTIONS
+                    )
             
             # Adjust timestamps based on chunk start time
             if start_time > 0:
@@ -306,49 +692,151 @@ class WhisperTranscriber:
             
             # Clean up any prompt contamination and subtitle hallucinations from the output text
             if "text" in result:
-                cleaned_text = result["text"]
-                
-                # Remove common prompt contaminations
-                prompt_phrases = [
-                    "한국어 음성을 정확하게 인식해주세요.",
-                    "안녕하세요.",
-                    "한국어 음성을 정확하게 인식해주세요",
-                    "안녕하세요"
-                ]
-                
-                # Remove common subtitle hallucinations
-                subtitle_hallucinations = [
-                    "자막제공자",
-                    "자막 제공자",
-                    "자막제공", 
-                    "자막 제공",
-                    "구독",
-                    "좋아요",
-                    "알림",
-                    "구독과 좋아요",
-                    "시청해주셔서 감사합니다",
-                    "채널 구독",
-                    "Subscribe",
-                    "Like"
-                ]
-                
-                # Clean all unwanted phrases
-                all_unwanted = prompt_phrases + subtitle_hallucinations
-                for phrase in all_unwanted:
-                    cleaned_text = cleaned_text.replace(phrase, "").strip()
-                
-                # Clean up multiple spaces and normalize
-                import re
-                cleaned_text = re.sub(r'\s+', ' ', cleaned_text).strip()
-                
-                result["text"] = cleaned_text
+                result["text"] = self._clean_transcript(result["text"])
             
             return result
             
         except Exception as e:
+            if self._is_out_of_memory(e):
+                # The caller retries with less memory; never save this as transcript text
+                raise
             print(f"    ❌ Error transcribing chunk {chunk_index + 1}: {e}")
             return {"text": f"[Error transcribing chunk {chunk_index + 1}: {e}]", "segments": []}
     
+    @staticmethod
+    def _is_out_of_memory(error: Exception) -> bool:
+        """Whether error is a host or CUDA out-of-memory error"""
+        if isinstance(error, MemoryError):
+            return True
+        cuda_oom = getattr(torch.cuda, 'OutOfMemoryError', None)  # torch >= 1.13
+        if cuda_oom is not None and isinstance(error, cuda_oom):
+            return True
+        # CTranslate2 (faster-whisper) reports CUDA allocation failures as RuntimeError
+        return isinstance(error, RuntimeError) and 'out of memory' in str(error).lower()
+    
+    def _clean_transcript(self, text: str) -> str:
+        """Remove prompt contamination and subtitle hallucinations from transcribed text"""
+        # Remove unwanted phrases, then clean up multiple spaces and normalize
+        return _WS_RE.sub(' ', _UNWANTED_RE.sub('', text)).strip()
+    
+    def _transcribe_faster_whisper(self, audio_file: str, language: str) -> dict:
+        """Transcribe with the faster-whisper backend, returning an openai-whisper style result"""
+        segments, _ = self.model.transcribe(
+            audio_file,
+            language=language,
+            condition_on_previous_text=False,
+            **self.FASTER_WHISPER_OPTIONS
+        )
+        return self._segments_to_result(segments)
+    
+    @staticmethod
+    def _segments_to_result(segments) -> dict:
+        """Collect faster-whisper segments into an openai-whisper style result dict"""
+        # Segments are generated lazily, decoding happens while iterating
+        segment_list = [{"start": seg.start, "end": seg.end, "text": seg.text} for seg in segments]
+        return {"text": "".join(seg["text"] for seg in segment_list), "segments": segment_list}
+    
+    def transcribe_batched(self, audio_file: str, language: str = "ko") -> dict:
+        """
+        Transcribe a whole file with faster-whisper's batched pipeline
+        
+        The audio is decoded once and cut into fixed 30-second windows, which are
+        encoded and decoded BATCH_SIZE at a time instead of one after another.
+        
+        Args:
+            audio_file (str): Path to the audio file
+            language (str): Language code to force recognition
+        
+        Returns:
+            dict: Result with 'text' (cleaned) and 'segments'
+        """
+        if not self.model:
+            self.load_model()
+        if self.batched_pipeline is None:
+            self.batched_pipeline = BatchedInferencePipeline(model=self.model)
+        
+        audio = decode_audio(audio_file, sampling_rate=self.SAMPLE_RATE)
+        window = self.WINDOW_SECONDS * self.SAMPLE_RATE
+        clips = [{"start": start, "end": min(start + window, len(audio))}
+                 for start in range(0, len(audio), window)]
+        
+        print(f"  🎯 Transcribing {len(clips)} windows in batches of {self.BATCH_SIZE} "
+              f"with Whisper {self.model_name}")
+        
+        segments, _ = self.batched_pipeline.transcribe(
+            audio,
+            language=language,
+            batch_size=self.BATCH_SIZE,
+            clip_timestamps=clips,
+            **self.FASTER_WHISPER_OPTIONS
+        )
+        result = self._segments_to_result(segments)
+        result["text"] = self._clean_transcript(result["text"])
+        return result
+    
+    def load_pcm(self, input_file: str) -> "np.ndarray":
+        """
+        Decode any FFmpeg input (MP4 included) to the samples Whisper consumes
+        
+        FFmpeg writes 16 kHz mono float32 PCM straight to a pipe, so no audio file
+        is written and read back, and no int16 to float conversion is needed. The
+        samples are read into a buffer kept from the previous file, sized from the
+        probed duration, so a batch does not allocate hundreds of MB per file.
+        
+        Args:
+            input_file (str): Path to the audio or video file
+        
+        Returns:
+            np.ndarray: float32 samples in [-1, 1], valid until the next load_pcm call
+        
+        Raises:
+            RuntimeError: If FFmpeg cannot decode the file
+        """
+        # One second of headroom over the probed length avoids a regrow at the end
+        expected = (int(_media_duration(input_file)) + 1) * self.SAMPLE_RATE * 4
+        if len(self._pcm_buffer) < expected:
+            self._pcm_buffer = bytearray(expected)
+        
+        cmd = [_FFMPEG, '-nostdin', '-threads', '0', '-i', input_file,
+               '-vn', '-sn', '-dn', '-map', '0:a:0', '-f', 'f32le', '-ac', '1', '-ar', str(self.SAMPLE_RATE),
+               '-v', 'error', 'pipe:1']
+        # FFmpeg's messages go to a temporary file: a stderr pipe that is only read
+        # after stdout ends would deadlock once FFmpeg fills it with errors
+        with tempfile.TemporaryFile() as error_log:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=error_log,
+                                       bufsize=1024 * 1024, creationflags=_NO_WINDOW)
+            total = self._read_pcm(process.stdout)
+            process.stdout.close()
+            
+            if process.wait() != 0:
+                error_log.seek(0)
+                errors = error_log.read().decode('utf-8', 'replace').strip()
+                raise RuntimeError(f"Failed to decode audio: {errors}")
+        return np.frombuffer(self._pcm_buffer, dtype=np.float32, count=total // 4)
+    
+    def _read_pcm(self, stream) -> int:
+        """Read stream to EOF into the PCM buffer, growing it as needed
+        
+        Returns:
+            int: Number of bytes read
+        """
+        total = 0
+        view = memoryview(self._pcm_buffer)
+        while True:
+            if total == len(view):
+                # Longer than probed: double the buffer, keeping what was read so far
+                grown = bytearray(max(2 * len(view), self.SAMPLE_RATE * 4))
+                grown[:total] = view[:total]
+                view.release()
+                self._pcm_buffer = grown
+                view = memoryview(grown)
+            read = stream.readinto(view[total:])
+            if not read:
+                break
+            total += read
+        view.release()
+        return total
+    
     def transcribe_chunks(self, chunk_files: List[str], chunk_duration: float, language: str = "ko") -> List[dict]:
         """Transcribe multiple audio chunks"""
         if not self.model:
@@ -372,17 +860,17 @@ class WhisperTranscriber:
     
     def merge_transcripts(self, results: List[dict]) -> str:
         """Merge multiple chunk transcripts into single text"""
-        merged_text = []
+        merged_text = io.StringIO()
         
         for i, result in enumerate(results):
             chunk_text = result.get("text", "").strip()
             if chunk_text:
                 # Add chunk separator for debugging (optional)
-                if len(results) > 1 and i > 0:
-                    merged_text.append(f"\n")
-                merged_text.append(chunk_text)
+                if i > 0:
+                    merged_text.write("\n")
+                merged_text.write(chunk_text)
         
-        return " ".join(merged_text).strip()
+        return merged_text.getvalue().strip()
     
     def transcribe_audio_file(self, audio_file: str, output_file: str = None, language: str = "ko") -> str:
         """Complete transcription pipeline for audio file"""
@@ -398,22 +886,68 @@ class WhisperTranscriber:
         splitter = AudioSplitter()
         
         try:
-            # Split audio file
-            chunk_files = splitter.split_audio_file(audio_file)
+            if not self.model:
+                self.load_model()
             
-            # Calculate chunk duration for timestamp adjustment
-            total_duration = splitter.get_audio_duration(audio_file)
-            chunk_duration = total_duration / len(chunk_files) if len(chunk_files) > 1 else 0
+            results = None
+            if self.backend == "faster-whisper":
+                # Batched windows over the whole file, no chunk files needed
+                try:
+                    results = [self.transcribe_batched(audio_file, language)]
+                except Exception as e:
+                    if not self._is_out_of_memory(e):
+                        raise
+                    # The chunk path below runs the unbatched model one file at a time
+                    print(f"  ⚠️ Not enough memory for batched transcription, transcribing in chunks")
+            else:
+                # Whisper windows the audio itself, so decode it once into memory
+                # (16 kHz mono float32) instead of writing chunk files
+                try:
+                    audio = self.load_pcm(audio_file)
+                    print(f"  🎯 Transcribing {len(audio) / self.SAMPLE_RATE / 60:.1f} minutes "
+                          f"with Whisper {self.model_name}")
+                    gpu_out_of_memory = False
+                    if self.device == "cuda":
+                        # Whisper computes the log-mel spectrogram on the samples' device:
+                        # one STFT of the whole file on the GPU instead of on the CPU
+                        try:
+                            results = [self.transcribe_chunk(torch.from_numpy(audio).to(self.device),
+                                                             0, 0, language)]
+                        except Exception as e:
+                            if not self._is_out_of_memory(e):
+                                raise
+                            gpu_out_of_memory = True
+                    if results is None:
+                        if gpu_out_of_memory:
+                            # The failed attempt's tensors are gone with its exception
+                            torch.cuda.empty_cache()
+                            print(f"  ⚠️ Not enough GPU memory for the whole file's spectrogram, "
+                                  f"computing it on the CPU")
+                        results = [self.transcribe_chunk(audio, 0, 0, language)]
+                    del audio
+                except Exception as e:
+                    if not self._is_out_of_memory(e):
+                        raise
+                    if self.device == "cuda":
+                        torch.cuda.empty_cache()
+                    print(f"  ⚠️ Not enough memory for the whole file, transcribing in chunks")
             
-            # Transcribe chunks
-            results = self.transcribe_chunks(chunk_files, chunk_duration, language)
+            if results is None:
+                # Split audio file
+                chunk_files = splitter.split_audio_file(audio_file)
+                
+                # Calculate chunk duration for timestamp adjustment
+                total_duration = splitter.get_audio_duration(audio_file)
+                chunk_duration = total_duration / len(chunk_files) if len(chunk_files) > 1 else 0
+                
+                # Transcribe chunks
+                results = self.transcribe_chunks(chunk_files, chunk_duration, language)
             
             # Merge results
             final_transcript = self.merge_transcripts(results)
             
-            # Save to file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(final_transcript)
+            # Save to file (one binary write, no text-layer newline translation)
+            Path(output_file).write_bytes(final_transcript.encode('utf-8'))
             
             print(f"  ✅ Transcription completed: {os.path.basename(output_file)}")
             print(f"  📝 Text length: {len(final_transcript)} characters")
@@ -424,82 +958,320 @@ class WhisperTranscriber:
             print(f"  ❌ Transcription failed: {e}")
             raise
         finally:
-            # Clean up temporary files
+            # Clean up temporary files (the model and its GPU memory stay loaded
+            # for the next file)
             splitter.cleanup_temp_files()
-            
-            # Clear GPU memory if using CUDA
-            if self.device == "cuda" and torch.cuda.is_available():
-                torch.cuda.empty_cache()
-                print(f"  🧹 GPU memory cleared")
 
 
 class AudioConverter:
     """Audio format converter using FFmpeg with progress tracking"""
     
-    def __init__(self):
-        """Initialize the audio converter"""
+    # AAC encoders in order of preference by quality, used when FFmpeg was built with
+    # them: AudioToolbox (macOS), Fraunhofer FDK, then FFmpeg's always-present native one
+    AAC_ENCODER_PREFERENCE = ['aac_at', 'libfdk_aac', 'aac']
+    
+    # LAME VBR quality (-q:a 0 best .. 9 smallest); 2 averages about 190 kbps
+    MP3_DEFAULT_QUALITY = 2
+    
+    # Average bitrate (kbps) LAME produces for each VBR quality, used by the PyAV
+    # backend, which cannot select libmp3lame's VBR mode
+    MP3_VBR_AVERAGE_KBPS = [245, 225, 190, 175, 165, 130, 115, 100, 85, 65]
+    
+    def __init__(self, threads: int = 0, force: bool = False, progress_counter=None,
+                 mp3_quality: int = None, mp3_bitrate: str = None, backend: str = "ffmpeg",
+                 show_progress: bool = True, log_status: bool = False):
+        """Initialize the audio converter
+        
+        Args:
+            threads: FFmpeg thread count per conversion (0 uses every core, None keeps
+                     the codec's own default, which is single-threaded for several encoders).
+                     Use 1 when several conversions run in parallel processes.
+            force: Convert even when the output file is newer than the input
+            progress_counter: Shared multiprocessing.Value('q') that accumulates the
+                              converted media time in microseconds, for a batch-wide
+                              progress bar. When set, no per-file bar is drawn.
+            mp3_quality: LAME VBR quality for MP3 outputs (None uses MP3_DEFAULT_QUALITY)
+            mp3_bitrate: Constant MP3 bitrate such as '128k', overrides mp3_quality
+            backend: "ffmpeg" runs the FFmpeg executable per conversion; "pyav" encodes
+                     direct MP3 conversions in-process with PyAV (falls back to FFmpeg
+                     when PyAV is not installed)
+            show_progress: Draw a per-file progress bar (off for conversions that run
+                           alongside other output, e.g. next to a transcription)
+            log_status: Send status lines to the 'mp4conv' logger instead of stdout
+                        (set in batch worker processes)
+        """
         self.supported_input_formats = ['.mp4', '.avi', '.mov', '.mkv']
         self.supported_audio_formats = ['.m4a', '.mp3', '.wav']
         self.progress_tracker = ProgressTracker()
+        self.threads = threads
+        self.force = force
+        self.progress_counter = progress_counter
+        self.show_progress = show_progress
+        self.log_status = log_status
+        self.mp3_quality = self.MP3_DEFAULT_QUALITY if mp3_quality is None else mp3_quality
+        self.mp3_bitrate = mp3_bitrate
+        if backend == "pyav" and not PYAV_AVAILABLE:
+            print("  ⚠️ PyAV not installed, using FFmpeg instead (pip install av)")
+            backend = "ffmpeg"
+        self.backend = backend
+        self._transcriber = None  # WhisperTranscriber, loaded on first transcription
+    
+    def _print(self, message: str):
+        """Print a status line, or log it when running as a batch worker
+        
+        Workers of a batch run (log_status set) send their lines through the
+        'mp4conv' logger instead, which the parent process forwards to its single
+        stdout writer, so lines from different workers do not interleave.
+        """
+        if not self.log_status:
+            print(message)
+        else:
+            # No progress bar to end with a newline in a worker
+            logger.info(message.lstrip('\n'))
+    
+    def _is_up_to_date(self, input_file: str, output_file: str) -> bool:
+        """Check whether a conversion can be skipped (output newer than input)"""
+        if self.force or not _up_to_date(input_file, output_file):
+            return False
+        self._print(f"  ⏭ Up to date, skipping: {os.path.basename(output_file)}")
+        return True
+    
+    def _copy_same_format(self, input_path: Path, output_path: Path) -> bool:
+        """Copy the input instead of converting it when it already has the target format
+        
+        Returns True when the output is in place (nothing is left to convert). The
+        input is never used as its own FFmpeg output.
+        """
+        if input_path.suffix.lower() != output_path.suffix.lower():
+            return False
+        if not (output_path.exists() and os.path.samefile(input_path, output_path)):
+            partial_file = _partial_path(output_path)
+            try:
+                shutil.copy2(input_path, partial_file)
+                os.replace(partial_file, output_path)
+            finally:
+                _remove_partials(partial_file)
+        self._print(f"  ✓ Already {output_path.suffix[1:].upper()}, no conversion needed: {output_path.name}")
+        return True
+    
+    def _thread_args(self, threads: int = None) -> list:
+        """Build the FFmpeg -threads option (empty list keeps FFmpeg's default)
+        
+        Args:
+            threads: Per-call thread count, overrides the converter-wide setting
+        """
+        threads = self.threads if threads is None else threads
+        return [] if threads is None else ['-threads', str(threads)]
+    
+    def _probe_audio_codec(self, input_file: str) -> Optional[str]:
+        """Return the codec name of the first audio stream (probed once per file version)
+        
+        Returns None if the file cannot be probed.
+        """
+        try:
+            st = os.stat(input_file)
+        except OSError:
+            return None
+        return _probe_codec(os.path.realpath(input_file), st.st_mtime_ns, st.st_size)
+    
+    def probe_many(self, input_files: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Probe the audio codec of many files at once and cache the results
+        
+        ffprobe accepts a single input per process, so the probes run
+        concurrently instead of one after another.
+        
+        Args:
+            input_files (list): Paths to the files to probe
+        
+        Returns:
+            dict: Input path -> audio codec name (None if the file cannot be probed)
+        """
+        with ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, max(1, len(input_files)))) as executor:
+            codecs = executor.map(self._probe_audio_codec, input_files)
+            return dict(zip(input_files, codecs))
+    
+    def _detect_aac_encoder(self) -> str:
+        """Return the most preferred AAC encoder this FFmpeg build provides"""
+        available = _ffmpeg_encoders()
+        for candidate in self.AAC_ENCODER_PREFERENCE:
+            if candidate in available:
+                return candidate
+        return 'aac'  # FFmpeg's native encoder is always built in
     
     def _run_ffmpeg_with_progress(self, cmd: list, input_file: str, operation_name: str) -> bool:
         """Run FFmpeg command with progress tracking"""
         try:
-            # Get duration for progress calculation
-            self.progress_tracker.duration = self.progress_tracker.get_video_duration(input_file)
+            # Duration for progress calculation: cached or read from the MP4 header,
+            # otherwise taken from FFmpeg's "Duration:" line while the conversion starts
+            self.progress_tracker.duration = self.progress_tracker.cached_duration(input_file)
             self.progress_tracker.current_time = 0
             self.progress_tracker.progress_percentage = 0
+            self.progress_tracker.last_drawn = None
             self.progress_tracker.is_running = True
             
-            print(f"  Converting... ({operation_name})")
-            
-            # Run FFmpeg with progress output
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1,
-                encoding='utf-8',
-                errors='replace'
-            )
+            self._print(f"  Converting... ({operation_name})")
             
-            # Monitor progress
-            last_percentage = 0
-            for line in process.stdout:
-                self.progress_tracker.parse_progress(line)
-                current_percentage = self.progress_tracker.progress_percentage
+            # A bar is pointless when the conversion is done before it would show
+            # anything, or when stdout is redirected and nobody watches it
+            no_bar = self.progress_counter is None and not (self.show_progress and sys.stdout
+                                                            and sys.stdout.isatty())
+            if 0 < self.progress_tracker.duration < SHORT_INPUT_SECONDS or no_bar:
+                # Skip the progress stream
+                returncode = subprocess.run(_without_progress_args(cmd),
+                                            stdout=subprocess.DEVNULL,
+                                            stderr=subprocess.DEVNULL).returncode
+                if returncode == 0 and self.progress_counter is not None:
+                    with self.progress_counter.get_lock():
+                        self.progress_counter.value += int(self.progress_tracker.duration * 1_000_000)
+            else:
+                # Run FFmpeg with progress output; the log on stderr is only read
+                # when the "Duration:" header is still needed
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT if self.progress_tracker.duration <= 0 else subprocess.DEVNULL,
+                    bufsize=1024 * 1024  # -progress lines arrive every ~0.5s, no need for line buffering
+                )
                 
-                # Update progress bar every 1%
-                if abs(current_percentage - last_percentage) >= 1:
-                    self.progress_tracker.show_progress_bar(current_percentage)
-                    last_percentage = current_percentage
-            
-            process.wait()
+                # Monitor progress (raw bytes: the progress stream is ASCII, nothing to decode)
+                last_draw = 0.0
+                reported_time = 0
+                for line in process.stdout:
+                    self.progress_tracker.parse_progress(line)
+                
+                    if self.progress_counter is not None:
+                        # Feed the batch-wide progress bar instead of drawing our own
+                        delta = self.progress_tracker.current_time - reported_time
+                        if delta > 0:
+                            with self.progress_counter.get_lock():
+                                self.progress_counter.value += int(delta * 1_000_000)
+                            reported_time = self.progress_tracker.current_time
+                        continue
+                
+                    current_percentage = self.progress_tracker.progress_percentage
+                
+                    # Redraw at most every PROGRESS_REDRAW_INTERVAL seconds
+                    now = time.monotonic()
+                    if now - last_draw >= PROGRESS_REDRAW_INTERVAL:
+                        self.progress_tracker.show_progress_bar(current_percentage)
+                        last_draw = now
+                
+                process.wait()
+                self.progress_tracker.remember_duration(input_file, self.progress_tracker.duration)
+                returncode = process.returncode
             
             # Final progress update
-            if process.returncode == 0:
-                self.progress_tracker.show_progress_bar(100)
-                print()  # New line after progress bar
+            if returncode == 0:
+                if self.progress_counter is None and self.show_progress:
+                    self.progress_tracker.show_progress_bar(100)
+                    print()  # New line after progress bar
                 return True
+            elif _FAST_INPUT_ARGS[0] in cmd:
+                # Shallow probing is not enough for some containers, retry with the defaults
+                self._print(f"\n  ⚠ Retrying with full input analysis...")
+                return self._run_ffmpeg_with_progress(_without_fast_input_args(cmd),
+                                                      input_file, operation_name)
             else:
-                print(f"\n  Error: FFmpeg process failed with return code {process.returncode}")
+                self._print(f"\n  Error: FFmpeg process failed with return code {returncode}")
                 return False
                 
         except Exception as e:
-            print(f"\n  Error during {operation_name}: {e}")
+            self._print(f"\n  Error during {operation_name}: {e}")
             return False
         finally:
             self.progress_tracker.is_running = False
     
-    def mp4_to_m4a(self, input_file: str, output_file: str = None) -> str:
+    def _m4a_cmd(self, input_file: str, output_file: str, encoder: str,
+                 threads: int = None, progress: bool = True) -> list:
+        """Build the FFmpeg command for MP4 → M4A ('copy' remuxes without re-encoding)"""
+        codec_args = ['-acodec', encoder]
+        if encoder != 'copy':
+            codec_args += ['-b:a', '128k']
+        
+        return [
+            _FFMPEG, '-nostdin', '-y', *(_FAST_INPUT_ARGS if progress else []), '-i', input_file,
+            '-vn', '-sn', '-dn',  # Audio only: no video, subtitle or data streams
+            '-map', '0:a:0',
+            *codec_args,
+            '-movflags', '+faststart',
+            '-f', 'mp4',  # Force MP4 container format for M4A
+            *self._thread_args(threads),
+            *_FILE_OUTPUT_ARGS,
+            *(_PROGRESS_ARGS if progress else ['-v', 'error']),
+            output_file
+        ]
+    
+    def _mp3_encode_args(self, quality: int = None, bitrate: str = None) -> list:
+        """Build the libmp3lame options (VBR quality, or CBR when a bitrate is given)
+        
+        Args:
+            quality: Per-call VBR quality, overrides the converter-wide setting
+            bitrate: Per-call constant bitrate, overrides the converter-wide setting
+        """
+        bitrate = bitrate or self.mp3_bitrate
+        if bitrate:
+            # Constant bitrate needs no Xing/Info header for players to seek or
+            # compute the duration, so skip writing it
+            return ['-acodec', 'libmp3lame', '-b:a', bitrate, '-write_xing', '0']
+        quality = self.mp3_quality if quality is None else quality
+        # VBR keeps the Xing header: players rely on it for duration and seeking
+        return ['-acodec', 'libmp3lame', '-q:a', str(quality)]
+    
+    def _mp3_codec_args(self, input_file: str) -> list:
+        """Build the FFmpeg audio options for an MP3 output"""
+        # Audio that is already MP3 only needs to be copied out of the container
+        if self._probe_audio_codec(input_file) == 'mp3':
+            return ['-map', '0:a:0', '-acodec', 'copy']
+        return ['-map', '0:a:0', *self._mp3_encode_args()]
+    
+    def _encode_mp3_pyav(self, input_file: str, output_file: str):
+        """Encode the first audio stream of input_file to an MP3 file in-process
+        
+        Decoding and encoding run in libav without starting an FFmpeg process, and
+        PyAV releases the GIL while doing so. A VBR quality is encoded at the
+        average bitrate LAME produces for it.
+        """
+        import av
+        
+        bitrate = self.mp3_bitrate or f"{self.MP3_VBR_AVERAGE_KBPS[self.mp3_quality]}k"
+        if bitrate.lower().endswith('k'):
+            bit_rate = int(float(bitrate[:-1]) * 1000)
+        else:
+            bit_rate = int(bitrate)
+        
+        with av.open(input_file) as inp, av.open(output_file, 'w', format='mp3') as outp:
+            in_stream = inp.streams.audio[0]
+            out_stream = outp.add_stream('libmp3lame', rate=in_stream.rate)
+            out_stream.layout = 'mono' if in_stream.channels == 1 else 'stereo'
+            out_stream.bit_rate = bit_rate
+            # Convert to the encoder's sample format and channel layout
+            resampler = av.AudioResampler(format='fltp', layout=out_stream.layout,
+                                          rate=out_stream.rate)
+            for frame in inp.decode(in_stream):
+                for resampled in resampler.resample(frame):
+                    outp.mux(out_stream.encode(resampled))
+            for resampled in resampler.resample(None):
+                outp.mux(out_stream.encode(resampled))
+            outp.mux(out_stream.encode(None))
+        
+        if self.progress_counter is not None:
+            with self.progress_counter.get_lock():
+                self.progress_counter.value += int(_media_duration(input_file) * 1_000_000)
+    
+    def mp4_to_m4a(self, input_file: str, output_file: str = None, threads: int = None) -> str:
         """
         Convert MP4 file to M4A format with progress tracking
         
+        AAC audio is stream-copied, so the M4A keeps the source's bitrate; other
+        codecs are encoded to 128 kbps AAC.
+        
         Args:
             input_file (str): Path to the input MP4 file
             output_file (str, optional): Path to the output M4A file. 
                                        If None, will use input filename with .m4a extension
+            threads (int, optional): FFmpeg thread count for this conversion.
+                                     If None, uses the converter-wide setting
         
         Returns:
             str: Path to the generated M4A file
@@ -508,10 +1280,11 @@ class AudioConverter:
             FileNotFoundError: If input file doesn't exist
             RuntimeError: If conversion fails
         """
+        input_file = os.fspath(input_file)
         input_path = Path(input_file)
         
         # Check if input file exists
-        if not input_path.exists():
+        if not os.path.isfile(input_file):
             raise FileNotFoundError(f"Input file not found: {input_file}")
         
         # Generate output filename if not provided
@@ -520,30 +1293,117 @@ class AudioConverter:
         
         output_path = Path(output_file)
         
+        if self._is_up_to_date(input_file, str(output_path)):
+            return str(output_path)
+        
+        if self._copy_same_format(input_path, output_path):
+            return str(output_path)
+        
+        partial_file = _partial_path(output_path)
         try:
-            # Prepare FFmpeg command with progress - audio only extraction
-            cmd = [
-                'ffmpeg', '-y', '-i', str(input_path),
-                '-vn',  # Disable video stream (audio only)
-                '-acodec', 'aac', '-b:a', '128k',
-                '-f', 'mp4',  # Force MP4 container format for M4A
-                '-progress', 'pipe:1', '-v', 'warning',
-                str(output_path)
-            ]
+            # Remux when the audio track is already AAC (or unknown - let FFmpeg try),
+            # otherwise go straight to encoding
+            codec = self._probe_audio_codec(input_file)
+            success = False
+            
+            if codec in (None, 'aac'):
+                # Remux the existing audio track
+                cmd = self._m4a_cmd(input_file, partial_file, 'copy', threads)
+                success = self._run_ffmpeg_with_progress(cmd, input_file, "MP4 → M4A (stream copy)")
             
-            success = self._run_ffmpeg_with_progress(cmd, str(input_path), "MP4 → M4A")
+            if not success:
+                # Audio codec cannot be stored in M4A as-is, encode to AAC
+                aac_encoder = self._detect_aac_encoder()
+                self._print(f"  ↻ Re-encoding {codec or 'audio'} to AAC with {aac_encoder}...")
+                cmd = self._m4a_cmd(input_file, partial_file, aac_encoder, threads)
+                success = self._run_ffmpeg_with_progress(cmd, input_file, "MP4 → M4A")
             
             # Verify output file was created
-            if not success or not output_path.exists():
+            if not success or not os.path.exists(partial_file):
                 raise RuntimeError("Conversion failed: output file was not created")
+            os.replace(partial_file, output_path)
             
-            print(f"  ✓ Successfully converted: {os.path.basename(input_file)} → {os.path.basename(output_file)}")
+            self._print(f"  ✓ Successfully converted: {input_path.name} → {output_path.name}")
             return str(output_path)
             
         except Exception as e:
             raise RuntimeError(f"Error during MP4 to M4A conversion: {e}")
+        finally:
+            _remove_partials(partial_file)
+    
+    def mp4_to_m4a_async(self, input_file: str, output_file: str = None,
+                         threads: int = None) -> Tuple[subprocess.Popen, str]:
+        """
+        Start an MP4 to M4A conversion without waiting for it to finish
+        
+        No progress bar is shown. The caller must collect the process with
+        finish_m4a_async(), which moves the M4A into place on success.
+        
+        Args:
+            input_file (str): Path to the input MP4 file
+            output_file (str, optional): Path to the output M4A file.
+                                       If None, will use input filename with .m4a extension
+            threads (int, optional): FFmpeg thread count for this conversion
+        
+        Returns:
+            tuple: (FFmpeg process, path to the M4A file being written).
+                   The process is None when the M4A is already up to date.
+        
+        Raises:
+            FileNotFoundError: If input file doesn't exist
+        """
+        input_file = os.fspath(input_file)
+        input_path = Path(input_file)
+        
+        if not os.path.isfile(input_file):
+            raise FileNotFoundError(f"Input file not found: {input_file}")
+        
+        if output_file is None:
+            output_file = str(input_path.with_suffix('.m4a'))
+        
+        if self._is_up_to_date(input_file, output_file):
+            return None, output_file
+        
+        codec = self._probe_audio_codec(input_file)
+        encoder = 'copy' if codec in (None, 'aac') else self._detect_aac_encoder()
+        cmd = self._m4a_cmd(input_file, _partial_path(output_file), encoder, threads, progress=False)
+        
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            encoding='utf-8',
+            errors='replace'
+        )
+        return process, output_file
+    
+    def finish_m4a_async(self, process: subprocess.Popen, output_file: str) -> str:
+        """
+        Wait for a conversion started by mp4_to_m4a_async and move its M4A into place
+        
+        Args:
+            process (subprocess.Popen): The FFmpeg process returned by mp4_to_m4a_async
+            output_file (str): The M4A path returned with it
+        
+        Returns:
+            str: Path to the generated M4A file
+        
+        Raises:
+            RuntimeError: If FFmpeg failed (the partial output is removed)
+        """
+        partial_file = _partial_path(output_file)
+        try:
+            _, stderr = process.communicate()
+            if process.returncode != 0:
+                raise RuntimeError(f"FFmpeg failed with return code {process.returncode}: {stderr.strip()}")
+            os.replace(partial_file, output_file)
+            return output_file
+        finally:
+            _remove_partials(partial_file)
     
-    def m4a_to_mp3(self, input_file: str, output_file: str = None) -> str:
+    def m4a_to_mp3(self, input_file: str, output_file: str = None, threads: int = None,
+                   quality: int = None, bitrate: str = None) -> str:
         """
         Convert M4A file to MP3 format with progress tracking
         
@@ -551,6 +1411,11 @@ class AudioConverter:
             input_file (str): Path to the input M4A file
             output_file (str, optional): Path to the output MP3 file.
                                        If None, will use input filename with .mp3 extension
+            threads (int, optional): FFmpeg thread count for this conversion.
+                                     If None, uses the converter-wide setting
+            quality (int, optional): LAME VBR quality, 0 (best) to 9 (smallest).
+                                     If None, uses the converter-wide setting
+            bitrate (str, optional): Constant bitrate such as '128k', overrides quality
         
         Returns:
             str: Path to the generated MP3 file
@@ -559,10 +1424,11 @@ class AudioConverter:
             FileNotFoundError: If input file doesn't exist
             RuntimeError: If conversion fails
         """
+        input_file = os.fspath(input_file)
         input_path = Path(input_file)
         
         # Check if input file exists
-        if not input_path.exists():
+        if not os.path.isfile(input_file):
             raise FileNotFoundError(f"Input file not found: {input_file}")
         
         # Generate output filename if not provided
@@ -571,79 +1437,66 @@ class AudioConverter:
         
         output_path = Path(output_file)
         
+        if self._is_up_to_date(input_file, str(output_path)):
+            return str(output_path)
+        
+        # An MP3 input only needs re-encoding when a different quality is asked for
+        if quality is None and bitrate is None and self._copy_same_format(input_path, output_path):
+            return str(output_path)
+        
+        partial_file = _partial_path(output_path)
         try:
             # Prepare FFmpeg command with progress - audio only
             cmd = [
-                'ffmpeg', '-y', '-i', str(input_path),
-                '-vn',  # Disable video stream (audio only)
-                '-acodec', 'mp3', '-b:a', '128k',
-                '-progress', 'pipe:1', '-v', 'warning',
-                str(output_path)
+                _FFMPEG, '-nostdin', '-y', *_FAST_INPUT_ARGS, '-i', input_file,
+                '-vn', '-sn', '-dn',  # Audio only: no video, subtitle or data streams
+                *self._mp3_encode_args(quality, bitrate),
+                *self._thread_args(threads),
+                *_FILE_OUTPUT_ARGS,
+                *_PROGRESS_ARGS,
+                partial_file
             ]
             
-            success = self._run_ffmpeg_with_progress(cmd, str(input_path), "M4A → MP3")
+            success = self._run_ffmpeg_with_progress(cmd, input_file, "M4A → MP3")
             
             # Verify output file was created
-            if not success or not output_path.exists():
+            if not success or not os.path.exists(partial_file):
                 raise RuntimeError("Conversion failed: output file was not created")
+            os.replace(partial_file, output_path)
             
-            print(f"  ✓ Successfully converted: {os.path.basename(input_file)} → {os.path.basename(output_file)}")
+            self._print(f"  ✓ Successfully converted: {input_path.name} → {output_path.name}")
             return str(output_path)
             
         except Exception as e:
             raise RuntimeError(f"Error during M4A to MP3 conversion: {e}")
+        finally:
+            _remove_partials(partial_file)
     
     def convert_mp4_to_mp3(self, input_file: str, output_file: str = None, keep_intermediate: bool = False) -> str:
         """
-        Convert MP4 file directly to MP3 format (combines mp4_to_m4a and m4a_to_mp3)
+        Convert MP4 file to MP3 format in a single FFmpeg pass
+        
+        The MP3 is encoded straight from the MP4's audio track, so there is no
+        intermediate M4A on disk and no second lossy decode/encode round trip.
         
         Args:
             input_file (str): Path to the input MP4 file
             output_file (str, optional): Path to the output MP3 file.
                                        If None, will use input filename with .mp3 extension
-            keep_intermediate (bool): Whether to keep the intermediate M4A file
+            keep_intermediate (bool): Whether to also write an M4A file next to the MP3
+                                      (extracted from the original MP4, not from the MP3)
         
         Returns:
             str: Path to the generated MP3 file
         """
-        input_path = Path(input_file)
+        if keep_intermediate:
+            # Both files from one FFmpeg process, the MP4 is read only once
+            _, mp3_file = self.mp4_to_m4a_and_mp3(input_file, mp3_file=output_file)
+            return mp3_file
         
-        # Generate intermediate M4A filename
-        m4a_file = str(input_path.with_suffix('.m4a'))
-        
-        # Generate final MP3 filename if not provided
-        if output_file is None:
-            output_file = str(input_path.with_suffix('.mp3'))
-        
-        try:
-            # Step 1: Convert MP4 to M4A
-            print(f"  Step 1: Converting {os.path.basename(input_file)} to M4A...")
-            self.mp4_to_m4a(input_file, m4a_file)
-            
-            # Step 2: Convert M4A to MP3
-            print(f"  Step 2: Converting {os.path.basename(m4a_file)} to MP3...")
-            result = self.m4a_to_mp3(m4a_file, output_file)
-            
-            # Clean up intermediate file if requested
-            if not keep_intermediate:
-                try:
-                    os.remove(m4a_file)
-                    print(f"  ✓ Cleaned up intermediate file: {os.path.basename(m4a_file)}")
-                except OSError as e:
-                    print(f"  ⚠ Warning: Could not remove intermediate file {m4a_file}: {e}")
-            
-            return result
-            
-        except Exception as e:
-            # Clean up intermediate file on error
-            if os.path.exists(m4a_file) and not keep_intermediate:
-                try:
-                    os.remove(m4a_file)
-                except OSError:
-                    pass
-            raise e
+        return self.convert_mp4_to_mp3_direct(input_file, output_file)
     
-    def convert_mp4_to_mp3_direct(self, input_file: str, output_file: str = None) -> str:
+    def convert_mp4_to_mp3_direct(self, input_file: str, output_file: str = None, threads: int = None) -> str:
         """
         Convert MP4 file directly to MP3 format (single step conversion)
         
@@ -651,14 +1504,17 @@ class AudioConverter:
             input_file (str): Path to the input MP4 file
             output_file (str, optional): Path to the output MP3 file.
                                        If None, will use input filename with .mp3 extension
+            threads (int, optional): FFmpeg thread count for this conversion.
+                                     If None, uses the converter-wide setting
         
         Returns:
             str: Path to the generated MP3 file
         """
+        input_file = os.fspath(input_file)
         input_path = Path(input_file)
         
         # Check if input file exists
-        if not input_path.exists():
+        if not os.path.isfile(input_file):
             raise FileNotFoundError(f"Input file not found: {input_file}")
         
         # Generate output filename if not provided
@@ -667,14 +1523,25 @@ class AudioConverter:
         
         output_path = Path(output_file)
         
+        if self._is_up_to_date(input_file, str(output_path)):
+            return str(output_path)
+        
+        if self._copy_same_format(input_path, output_path):
+            return str(output_path)
+        
+        partial_file = _partial_path(output_path)
         try:
+            codec_args = self._mp3_codec_args(input_file)
+            
             # Prepare FFmpeg command for direct MP4 to MP3 conversion - audio only
             cmd = [
-                'ffmpeg', '-y', '-i', str(input_path),
-                '-vn',  # Disable video stream (audio only)
-                '-acodec', 'mp3', '-b:a', '128k',
-                '-progress', 'pipe:1', '-v', 'warning',
-                str(output_path)
+                _FFMPEG, '-nostdin', '-y', *_FAST_INPUT_ARGS, '-i', input_file,
+                '-vn', '-sn', '-dn',  # Audio only: no video, subtitle or data streams
+                *codec_args,
+                *self._thread_args(threads),
+                *_FILE_OUTPUT_ARGS,
+                *_PROGRESS_ARGS,
+                partial_file
             ]
             
             # Detect input file type for proper labeling
@@ -683,25 +1550,199 @@ class AudioConverter:
                 operation_label = "M4A → MP3"
             else:
                 operation_label = "MP4 → MP3 (Direct)"
+            if codec_args[-1] == 'copy':
+                operation_label += " (stream copy)"
             
-            success = self._run_ffmpeg_with_progress(cmd, str(input_path), operation_label)
+            if self.backend == "pyav" and codec_args[-1] != 'copy':
+                # In-process encode, no FFmpeg process to start for this file
+                self._print(f"  🔄 {operation_label} (PyAV)...")
+                self._encode_mp3_pyav(input_file, partial_file)
+                success = True
+            else:
+                success = self._run_ffmpeg_with_progress(cmd, input_file, operation_label)
             
             # Verify output file was created
-            if not success or not output_path.exists():
+            if not success or not os.path.exists(partial_file):
                 raise RuntimeError("Conversion failed: output file was not created")
+            os.replace(partial_file, output_path)
             
-            print(f"  ✓ Successfully converted: {os.path.basename(input_file)} → {os.path.basename(output_file)}")
+            self._print(f"  ✓ Successfully converted: {input_path.name} → {output_path.name}")
             return str(output_path)
             
         except Exception as e:
             raise RuntimeError(f"Error during MP4 to MP3 conversion: {e}")
+        finally:
+            _remove_partials(partial_file)
+    
+    def batch_to_mp3(self, input_files: List[str], threads: int = None) -> List[str]:
+        """
+        Convert several files to MP3 with a single FFmpeg process
+        
+        Meant for many short clips, where FFmpeg start-up dominates the encode time.
+        No progress bar is shown for batched conversions. Batching always runs the
+        FFmpeg executable, whatever the backend; missing inputs are left out of the
+        batch, and a failed batch produces nothing, so callers can convert the files
+        that are not in the returned list one by one.
+        
+        Args:
+            input_files (list): Paths to the input MP4/M4A files
+            threads (int, optional): FFmpeg thread count for each output
+        
+        Returns:
+            list: Paths to the generated or already up-to-date MP3 files
+                  (only the up-to-date ones if the batch failed)
+        """
+        cmd = [_FFMPEG, '-nostdin', '-y', '-v', 'warning']
+        up_to_date = []
+        pending = []
+        
+        for input_file in input_files:
+            if not os.path.exists(input_file):
+                # The per-file fallback reports it
+                continue
+            output_file = str(Path(input_file).with_suffix('.mp3'))
+            if self._is_up_to_date(input_file, output_file):
+                up_to_date.append(output_file)
+            else:
+                pending.append((input_file, output_file))
+        
+        if not pending:
+            return up_to_date
+        
+        for input_file, _ in pending:
+            cmd += ['-i', input_file]
+        
+        # One MP3 output per input, each mapped to its own audio stream
+        partial_files = [_partial_path(output_file) for _, output_file in pending]
+        for index, partial_file in enumerate(partial_files):
+            cmd += [
+                '-map', f'{index}:a:0',
+                *self._mp3_encode_args(),
+                *self._thread_args(threads),
+                *_FILE_OUTPUT_ARGS,
+                partial_file
+            ]
+        
+        self._print(f"  Converting {len(pending)} files in one FFmpeg process...")
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True,
+                                    encoding='utf-8', errors='replace')
+            
+            if result.returncode != 0:
+                # Outputs the batch did finish may still be incomplete, keep none of them
+                self._print(f"  ⚠ Batched conversion failed with return code {result.returncode}")
+                return up_to_date
+            
+            for partial_file, (_, output_file) in zip(partial_files, pending):
+                os.replace(partial_file, output_file)
+        except OSError as e:
+            # FFmpeg missing, or an output that could not be moved into place
+            self._print(f"  ⚠ Batched conversion failed: {e}")
+            return up_to_date
+        finally:
+            _remove_partials(*partial_files)
+        
+        return up_to_date + [output_file for _, output_file in pending]
+    
+    def mp4_to_m4a_and_mp3(self, input_file: str, threads: int = None,
+                           mp3_file: str = None) -> Tuple[str, str]:
+        """
+        Convert MP4 file to both M4A and MP3 with a single FFmpeg process
+        
+        The audio is demuxed once and fed to both outputs, so no intermediate
+        file is written and read back.
+        
+        Args:
+            input_file (str): Path to the input MP4 file
+            threads (int, optional): FFmpeg thread count for this conversion
+            mp3_file (str, optional): Path to the output MP3 file.
+                                    If None, will use input filename with .mp3 extension
+        
+        Returns:
+            tuple: (path to the M4A file, path to the MP3 file)
+        
+        Raises:
+            FileNotFoundError: If input file doesn't exist
+            RuntimeError: If conversion fails
+        """
+        input_file = os.fspath(input_file)
+        input_path = Path(input_file)
+        
+        # Check if input file exists
+        if not os.path.isfile(input_file):
+            raise FileNotFoundError(f"Input file not found: {input_file}")
+        
+        m4a_path = input_path.with_suffix('.m4a')
+        mp3_path = input_path.with_suffix('.mp3') if mp3_file is None else Path(mp3_file)
+        
+        if (self._is_up_to_date(input_file, str(m4a_path)) and
+                self._is_up_to_date(input_file, str(mp3_path))):
+            return str(m4a_path), str(mp3_path)
+        
+        m4a_partial = _partial_path(m4a_path)
+        mp3_partial = _partial_path(mp3_path)
+        try:
+            codec = self._probe_audio_codec(input_file)
+            if codec in (None, 'aac'):
+                m4a_codec_args = ['-acodec', 'copy']
+            else:
+                m4a_codec_args = ['-acodec', self._detect_aac_encoder(), '-b:a', '128k']
+            
+            # One input, two outputs: M4A (remux or AAC) and MP3
+            cmd = [
+                _FFMPEG, '-nostdin', '-y', *_FAST_INPUT_ARGS, '-i', input_file,
+                *_PROGRESS_ARGS,
+                '-vn', '-sn', '-dn', '-map', '0:a:0', *m4a_codec_args,
+                '-movflags', '+faststart', '-f', 'mp4',
+                *self._thread_args(threads),
+                *_FILE_OUTPUT_ARGS,
+                m4a_partial,
+                '-vn', '-sn', '-dn', *self._mp3_codec_args(input_file),
+                *self._thread_args(threads),
+                *_FILE_OUTPUT_ARGS,
+                mp3_partial
+            ]
+            
+            success = self._run_ffmpeg_with_progress(cmd, input_file, "MP4 → M4A + MP3")
+            
+            # Verify output files were created
+            if not success or not os.path.exists(m4a_partial) or not os.path.exists(mp3_partial):
+                raise RuntimeError("Conversion failed: output files were not created")
+            os.replace(m4a_partial, m4a_path)
+            os.replace(mp3_partial, mp3_path)
+            
+            self._print(f"  ✓ Successfully converted: {input_path.name} → {m4a_path.name}, {mp3_path.name}")
+            return str(m4a_path), str(mp3_path)
+            
+        except Exception as e:
+            raise RuntimeError(f"Error during MP4 to M4A/MP3 conversion: {e}")
+        finally:
+            _remove_partials(m4a_partial, mp3_partial)
+    
+    def load_transcriber(self, compute_type: str = "auto") -> WhisperTranscriber:
+        """
+        Load the Whisper model once and reuse it for every following file
+        
+        Args:
+            compute_type (str): Model precision (see WhisperTranscriber.COMPUTE_TYPES),
+                                used when the model is first loaded
+        
+        Returns:
+            WhisperTranscriber: The transcriber with its model loaded
+        """
+        if self._transcriber is None:
+            self._transcriber = WhisperTranscriber(model_name="large-v3", device="auto",
+                                                   compute_type=compute_type)
+            self._transcriber.load_model()
+        return self._transcriber
     
     def transcribe_audio_to_text(self, audio_file: str, output_file: str = None, force_language: str = "ko") -> str:
         """
         Transcribe audio file to text using local Whisper AI with forced Korean language
         
         Args:
-            audio_file (str): Path to the input audio file (M4A, MP3, WAV)
+            audio_file (str): Path to the input audio file (M4A, MP3, WAV) or an MP4,
+                              whose audio track is decoded directly
             output_file (str, optional): Path to the output text file.
                                        If None, will use input filename with .txt extension
             force_language (str): Language code to force recognition (default: "ko" for Korean)
@@ -713,7 +1754,7 @@ class AudioConverter:
             FileNotFoundError: If input file doesn't exist
             RuntimeError: If transcription fails
         """
-        if not WHISPER_AVAILABLE:
+        if not _import_whisper():
             raise RuntimeError("Whisper AI is not available. Please install with: pip install openai-whisper torch")
         
         input_path = Path(audio_file)
@@ -731,11 +1772,8 @@ class AudioConverter:
             print(f"  🎵 Input: {os.path.basename(audio_file)}")
             print(f"  📝 Output: {os.path.basename(output_file)}")
             
-            # Initialize Whisper transcriber
-            transcriber = WhisperTranscriber(model_name="large-v3", device="auto")
-            
             # Perform transcription with forced Korean
-            result_file = transcriber.transcribe_audio_file(audio_file, output_file, force_language)
+            result_file = self.load_transcriber().transcribe_audio_file(audio_file, output_file, force_language)
             
             print(f"  🎉 Transcription completed successfully!")
             return result_file
@@ -744,6 +1782,27 @@ class AudioConverter:
             raise RuntimeError(f"Error during audio transcription: {e}")
 
 
+@functools.lru_cache(maxsize=32)
+def _scan_dir(directory: str, mtime_ns: int) -> tuple:
+    """
+    List the regular files of a directory with one os.scandir pass
+    
+    mtime_ns only keys the cache: adding or removing a file changes the directory's
+    mtime, so a changed directory is read again.
+    
+    Returns:
+        tuple: (path, lowercased file name) pairs
+    """
+    with os.scandir(directory) as entries:
+        return tuple((entry.path, entry.name.lower()) for entry in entries if entry.is_file())
+
+
+def _find_files(directory: str, extensions) -> list:
+    """Sorted paths of the files in directory whose name ends with one of extensions"""
+    files = _scan_dir(directory, os.stat(directory).st_mtime_ns)
+    return sorted(path for path, name in files if name.endswith(extensions))
+
+
 def find_audio_files(directory: str = ".") -> list:
     """
     Find all audio files in the specified directory
@@ -754,14 +1813,8 @@ def find_audio_files(directory: str = ".") -> list:
     Returns:
         list: List of audio file paths (M4A, MP3, WAV)
     """
-    patterns = ["*.m4a", "*.M4A", "*.mp3", "*.MP3", "*.wav", "*.WAV"]
-    audio_files = []
-    
-    for pattern in patterns:
-        search_path = os.path.join(directory, pattern)
-        audio_files.extend(glob.glob(search_path))
-    
-    return sorted(list(set(audio_files)))  # Remove duplicates and sort
+    # Case-insensitive extension check over a shared, cached directory listing
+    return _find_files(directory, _AUDIO_EXTENSIONS)
 
 
 def find_mp4_files(directory: str = ".") -> list:
@@ -774,14 +1827,8 @@ def find_mp4_files(directory: str = ".") -> list:
     Returns:
         list: List of MP4 file paths
     """
-    patterns = ["*.mp4", "*.MP4"]
-    mp4_files = []
-    
-    for pattern in patterns:
-        search_path = os.path.join(directory, pattern)
-        mp4_files.extend(glob.glob(search_path))
-    
-    return sorted(list(set(mp4_files)))  # Remove duplicates and sort
+    # Case-insensitive extension check over a shared, cached directory listing
+    return _find_files(directory, '.mp4')
 
 
 def find_m4a_files(directory: str = ".") -> list:
@@ -794,14 +1841,8 @@ def find_m4a_files(directory: str = ".") -> list:
     Returns:
         list: List of M4A file paths
     """
-    patterns = ["*.m4a", "*.M4A"]
-    m4a_files = []
-    
-    for pattern in patterns:
-        search_path = os.path.join(directory, pattern)
-        m4a_files.extend(glob.glob(search_path))
-    
-    return sorted(list(set(m4a_files)))  # Remove duplicates and sort
+    # Case-insensitive extension check over a shared, cached directory listing
+    return _find_files(directory, '.m4a')
 
 
 def print_banner():
@@ -813,6 +1854,16 @@ def print_banner():
     print()
 
 
+def pause_on_exit() -> bool:
+    """Whether to wait for Enter before exiting
+    
+    Only an interactive console is kept open; scripts, pipes and worker processes
+    (or MP4CONV_NO_PAUSE=1) exit right away instead of blocking on input().
+    """
+    return (sys.stdin is not None and sys.stdin.isatty()
+            and os.environ.get('MP4CONV_NO_PAUSE') != '1')
+
+
 def print_help():
     """Print help information"""
     print("Usage:")
@@ -840,6 +1891,10 @@ def print_help():
     print("  --mp3-only            Only convert to MP3 format (direct)")
     print("  --both                Convert to both M4A and MP3 formats")
     print("  --transcribe          Convert MP4 to text using Whisper AI")
+    print("  --force               Convert even if the outputs are newer than the inputs")
+    print("  --compute-type=<type> Whisper precision: auto, int8, int8_float16, float16,")
+    print("                        float32 (default: auto)")
+    print("  --no-pause            Exit without waiting for Enter at the end")
     print()
 
 
@@ -972,6 +2027,22 @@ def select_output_format(file_count: int = 1) -> tuple:
     return format_choice, keep_intermediate
 
 
+# Output descriptions shown by confirm_workflow ('both' depends on keep_intermediate)
+_AUDIO_ONLY_DESCRIPTIONS = {
+    'mp3': "MP3 format only (direct conversion)",
+    'm4a': "M4A format only",
+}
+_AUDIO_AND_TEXT_DESCRIPTIONS = {
+    'mp3': "MP3 + Text files",
+    'm4a': "M4A + Text files",
+}
+
+
+def _intermediate_note(keep_intermediate: bool) -> str:
+    """Describe what happens to the M4A of a 'both' conversion"""
+    return '(keeping M4A)' if keep_intermediate else '(removing intermediate M4A)'
+
+
 def confirm_workflow(input_files: list, workflow_type: str, format_choice: str = None, keep_intermediate: bool = False) -> bool:
     """
     Show workflow summary and ask for confirmation
@@ -1005,37 +2076,31 @@ def confirm_workflow(input_files: list, workflow_type: str, format_choice: str =
     print(f"🎯 Workflow: {workflow_type.replace('-', ' ').title()}")
     
     if workflow_type == "audio-only":
-        format_descriptions = {
-            'mp3': "MP3 format only (direct conversion)",
-            'm4a': "M4A format only",
-            'both': f"Both M4A and MP3 formats {'(keeping M4A)' if keep_intermediate else '(removing intermediate M4A)'}"
-        }
-        print(f"📄 Output: {format_descriptions[format_choice]}")
+        description = (_AUDIO_ONLY_DESCRIPTIONS.get(format_choice) or
+                       f"Both M4A and MP3 formats {_intermediate_note(keep_intermediate)}")
+        print(f"📄 Output: {description}")
         
     elif workflow_type == "m4a-to-mp3":
         print(f"📄 Output: Convert M4A files to MP3 format")
         
     elif workflow_type == "text-only":
         print(f"📄 Output: Text files (.txt) using Whisper AI large-v3 model")
-        if WHISPER_AVAILABLE:
-            print(f"🤖 AI Model: Local Whisper with {'GPU' if torch.cuda.is_available() else 'CPU'} acceleration")
+        if _import_whisper():
+            print(f"🤖 AI Model: Local Whisper with {'GPU' if _cuda_available() else 'CPU'} acceleration")
         else:
             print(f"⚠️  Warning: Whisper AI not installed")
             
     elif workflow_type == "audio-and-text":
-        format_descriptions = {
-            'mp3': "MP3 + Text files",
-            'm4a': "M4A + Text files", 
-            'both': f"Both M4A and MP3 + Text files {'(keeping M4A)' if keep_intermediate else '(removing intermediate M4A)'}"
-        }
-        print(f"📄 Output: {format_descriptions[format_choice]}")
-        if WHISPER_AVAILABLE:
-            print(f"🤖 AI Model: Local Whisper with {'GPU' if torch.cuda.is_available() else 'CPU'} acceleration")
+        description = (_AUDIO_AND_TEXT_DESCRIPTIONS.get(format_choice) or
+                       f"Both M4A and MP3 + Text files {_intermediate_note(keep_intermediate)}")
+        print(f"📄 Output: {description}")
+        if _import_whisper():
+            print(f"🤖 AI Model: Local Whisper with {'GPU' if _cuda_available() else 'CPU'} acceleration")
             
     elif workflow_type == "m4a-mp3-and-text":
         print(f"📄 Output: Convert M4A to MP3 + Text files")
-        if WHISPER_AVAILABLE:
-            print(f"🤖 AI Model: Local Whisper with {'GPU' if torch.cuda.is_available() else 'CPU'} acceleration")
+        if _import_whisper():
+            print(f"🤖 AI Model: Local Whisper with {'GPU' if _cuda_available() else 'CPU'} acceleration")
     
     print()
     
@@ -1059,32 +2124,259 @@ def confirm_workflow(input_files: list, workflow_type: str, format_choice: str =
             sys.exit(0)
 
 
+def _format_eta(seconds: float) -> str:
+    """Format a remaining-time estimate as 'Xm Ys'"""
+    return f"{int(seconds // 60)}m {int(seconds % 60)}s"
+
+
+def _setup_logging() -> logging.Handler:
+    """Send the workflow log to stdout as plain lines and return the handler"""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.handlers[:] = [handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return handler
+
+
+def _init_worker(log_queue=None, force=False):
+    """Pool initializer: forward logs to the parent process through log_queue"""
+    global _worker_force
+    _worker_force = force
+    if log_queue is not None:
+        logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+
+def _convert_audio(input_file: str, workflow_type: str, format_choice: str,
+                   keep_intermediate: bool, converter: 'AudioConverter') -> str:
+    """
+    Step 1 of a workflow: the audio conversion of a single input file
+    
+    Args:
+        input_file (str): Path to the MP4 or M4A file
+        workflow_type (str): Workflow selected in main()
+        format_choice (str): 'm4a', 'mp3', 'both' or None
+        keep_intermediate (bool): Keep the M4A file of an MP4 → M4A + MP3 conversion
+        converter (AudioConverter): Converter to use
+    
+    Returns:
+        str: The audio file to transcribe (None if the workflow has no text step)
+    """
+    input_path = Path(input_file)
+    
+    audio_file = None  # Track intermediate audio file for text conversion
+    
+    # Determine file extension for processing logic
+    file_ext = input_path.suffix.lower()
+    
+    if file_ext == '.mp4':
+        # MP4 file processing
+        if workflow_type in ["audio-only", "audio-and-text"]:
+            if format_choice == "m4a":
+                # Convert only to M4A
+                audio_file = converter.mp4_to_m4a(input_file)
+                logger.info(f"✅ M4A conversion completed: {os.path.basename(audio_file)}")
+                
+            elif format_choice == "mp3":
+                # Convert directly to MP3
+                audio_file = converter.convert_mp4_to_mp3_direct(input_file)
+                logger.info(f"✅ MP3 conversion completed: {os.path.basename(audio_file)}")
+                
+            elif format_choice == "both" and not keep_intermediate and workflow_type == "audio-only":
+                # The M4A would only be deleted again, so write the MP3 alone
+                audio_file = converter.convert_mp4_to_mp3_direct(input_file)
+                logger.info(f"✅ MP3 conversion completed: {os.path.basename(audio_file)}")
+                
+            elif format_choice == "both":
+                # Convert to both M4A and MP3 with one FFmpeg process
+                m4a_file, mp3_file = converter.mp4_to_m4a_and_mp3(input_file)
+                logger.info(f"✅ M4A conversion completed: {os.path.basename(m4a_file)}")
+                logger.info(f"✅ MP3 conversion completed: {os.path.basename(mp3_file)}")
+                
+                # Use M4A for text conversion (better quality)
+                audio_file = m4a_file
+        
+        elif workflow_type == "text-only":
+            # Decode the MP4's audio track straight into Whisper, no temporary audio file
+            audio_file = input_file
+                        
+    elif file_ext == '.m4a':
+        # M4A file processing
+        if workflow_type in ["m4a-to-mp3", "m4a-mp3-and-text"]:
+            # Convert M4A to MP3
+            audio_file = converter.m4a_to_mp3(input_file)
+            logger.info(f"✅ MP3 conversion completed: {os.path.basename(audio_file)}")
+        elif workflow_type == "text-only":
+            # Use M4A file directly for transcription
+            audio_file = input_file
+    
+    return audio_file
+
+
+def _transcribe_audio(audio_file: str, converter: 'AudioConverter'):
+    """Step 2 of a workflow: transcribe the converted audio to a text file"""
+    logger.info(f"  🤖 Starting AI transcription...")
+    text_file = converter.transcribe_audio_to_text(audio_file)
+    logger.info(f"✅ Text transcription completed: {os.path.basename(text_file)}")
+
+
+def _process_file(input_file: str, workflow_type: str, format_choice: str,
+                  keep_intermediate: bool, converter: 'AudioConverter' = None) -> tuple:
+    """
+    Run the selected workflow for a single input file
+    
+    Args:
+        input_file (str): Path to the MP4 or M4A file
+        workflow_type (str): Workflow selected in main()
+        format_choice (str): 'm4a', 'mp3', 'both' or None
+        keep_intermediate (bool): Keep the M4A file of an MP4 → M4A + MP3 conversion
+        converter (AudioConverter, optional): Converter to use. If None (inside a
+                                              worker process), a single-threaded
+                                              converter without progress bar is created
+    
+    Returns:
+        tuple: (success, file name, error message or None)
+    """
+    if converter is None:
+        converter = AudioConverter(threads=1, force=_worker_force,
+                                   show_progress=False, log_status=True)
+    
+    file_name = Path(input_file).name
+    
+    try:
+        # Step 1: Audio conversion based on file type and workflow
+        audio_file = _convert_audio(input_file, workflow_type, format_choice,
+                                    keep_intermediate, converter)
+        
+        # Step 2: Text conversion (if needed)
+        if workflow_type in TEXT_WORKFLOWS:
+            _transcribe_audio(audio_file, converter)
+        
+        logger.info(f"🎉 Successfully processed: {file_name}")
+        return True, file_name, None
+        
+    except Exception as e:
+        return False, file_name, str(e)
+
+
+def _process_files(input_files: list, workflow_type: str, format_choice: str,
+                   keep_intermediate: bool, batched: bool = False) -> list:
+    """
+    Run the selected workflow for a group of files (one task of a worker process)
+    
+    Args:
+        input_files (list): Paths to the MP4 or M4A files of this group
+        workflow_type (str): Workflow selected in main()
+        format_choice (str): 'm4a', 'mp3', 'both' or None
+        keep_intermediate (bool): Keep the M4A file of an MP4 → M4A + MP3 conversion
+        batched (bool): Convert the group to MP3 with a single FFmpeg process.
+                        Files the batched command did not produce are retried one by one.
+    
+    Returns:
+        list: One (success, file name, error message or None) tuple per input file
+    """
+    converter = AudioConverter(threads=1, force=_worker_force,
+                               show_progress=False, log_status=True)
+    created = set(converter.batch_to_mp3(input_files)) if batched else set()
+    
+    results = []
+    for input_file in input_files:
+        input_path = Path(input_file)
+        mp3_path = input_path.with_suffix('.mp3')
+        if str(mp3_path) in created:
+            logger.info(f"✅ MP3 conversion completed: {mp3_path.name}")
+            results.append((True, input_path.name, None))
+        else:
+            results.append(_process_file(input_file, workflow_type, format_choice,
+                                         keep_intermediate, converter))
+    return results
+
+
+def _process_files_pipelined(input_files: list, workflow_type: str, format_choice: str,
+                             keep_intermediate: bool, converter: 'AudioConverter'):
+    """
+    Run a convert-and-transcribe workflow with the two steps overlapped
+    
+    A background thread runs the FFmpeg conversions in order while the calling
+    thread transcribes the files already converted, so the CPU-bound conversion of
+    the next file overlaps the GPU-bound transcription of the current one.
+    
+    Args:
+        input_files (list): Paths to the MP4 or M4A files
+        workflow_type (str): 'audio-and-text' or 'm4a-mp3-and-text'
+        format_choice (str): 'm4a', 'mp3', 'both' or None
+        keep_intermediate (bool): Keep the M4A file of an MP4 → M4A + MP3 conversion
+        converter (AudioConverter): Converter whose Whisper model does the transcription
+    
+    Yields:
+        tuple: (success, file name, error message or None), in input order
+    """
+    # Own converter for the conversion thread, without progress bars that would
+    # interleave with the transcription output
+    audio_converter = AudioConverter(threads=converter.threads, force=converter.force,
+                                     show_progress=False,
+                                     mp3_quality=converter.mp3_quality,
+                                     mp3_bitrate=converter.mp3_bitrate)
+    
+    executor = ThreadPoolExecutor(max_workers=1)
+    
+    def convert(input_file):
+        return executor.submit(_convert_audio, input_file, workflow_type, format_choice,
+                               keep_intermediate, audio_converter)
+    
+    try:
+        # Only the next file is converted ahead, so stopping (Ctrl+C, or the caller
+        # closing the generator) waits for at most one FFmpeg run
+        conversion = convert(input_files[0]) if input_files else None
+        for index, input_file in enumerate(input_files):
+            file_name = Path(input_file).name
+            current = conversion
+            conversion = convert(input_files[index + 1]) if index + 1 < len(input_files) else None
+            try:
+                _transcribe_audio(current.result(), converter)
+                print(f"🎉 Successfully processed: {file_name}")
+                yield True, file_name, None
+            except Exception as e:
+                yield False, file_name, str(e)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def main():
     """Main function for the Enhanced PoC with Audio-to-Text capabilities"""
+    log_handler = _setup_logging()
     print_banner()
     
-    # Parse command line arguments
-    args = sys.argv[1:]
-    keep_intermediate_flag = "--keep-intermediate" in args
-    m4a_only_flag = "--m4a-only" in args
-    mp3_only_flag = "--mp3-only" in args
-    both_flag = "--both" in args
-    transcribe_flag = "--transcribe" in args
+    # Parse command line arguments (one pass into a set of options)
+    options = set(sys.argv[1:])
+    keep_intermediate_flag = "--keep-intermediate" in options
+    m4a_only_flag = "--m4a-only" in options
+    mp3_only_flag = "--mp3-only" in options
+    both_flag = "--both" in options
+    transcribe_flag = "--transcribe" in options
+    no_pause_flag = "--no-pause" in options
+    force_flag = "--force" in options
+    # Value options use the --name=value form; bare arguments are input files
+    compute_type = next((arg.split("=", 1)[1] for arg in options
+                         if arg.startswith("--compute-type=")), "auto")
     
     # Remove flags from args
-    args = [arg for arg in args if not arg.startswith("--")]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
     
     # Check for help
-    if "--help" in sys.argv or "-h" in sys.argv:
+    if "--help" in options or "-h" in options:
         print_help()
         return
     
     # Initialize converter
-    converter = AudioConverter()
+    converter = AudioConverter(force=force_flag)
     
     # Determine input files
     input_files = []
     file_type = "MP4"  # Default file type
+    used_batch_input = False  # Inputs come from run/input (transcripts go to run/output)
     
     if args:
         # Specific file provided
@@ -1104,13 +2396,22 @@ def main():
         else:
             print(f"❌ Error: Unsupported file type '{file_ext}'. Supported: .mp4, .m4a")
             sys.exit(1)
+        
+        # Whole path components only, so run/input2 or run/inputs do not count
+        batch_input_dir = os.path.join(os.getcwd(), "run", "input")
+        try:
+            used_batch_input = os.path.commonpath(
+                [os.path.abspath(input_file), batch_input_dir]) == batch_input_dir
+        except ValueError:
+            used_batch_input = False  # On another drive (Windows)
     else:
-        # Check for batch processing directory first
-        input_dir = os.path.join(os.getcwd(), "run", "input")
+        # Check for batch processing directory first (one stat, reused below)
         current_dir = os.getcwd()
+        input_dir = os.path.join(current_dir, "run", "input")
+        has_batch_input = os.path.isdir(input_dir)
         
         # Look for MP4 files first
-        if os.path.exists(input_dir):
+        if has_batch_input:
             mp4_files = find_mp4_files(input_dir)
             m4a_files = find_m4a_files(input_dir)
         else:
@@ -1151,22 +2452,25 @@ def main():
         
         if not input_files:
             print("No supported files found.")
-            if os.path.exists(input_dir):
+            if has_batch_input:
                 print(f"Checked directories:")
                 print(f"  - Batch input: {input_dir}")
-                print(f"  - Current: {os.getcwd()}")
+                print(f"  - Current: {current_dir}")
             else:
-                print(f"Current directory: {os.getcwd()}")
+                print(f"Current directory: {current_dir}")
             print("\nSupported file extensions: .mp4, .MP4, .m4a, .M4A")
             print("\n💡 Tip: Place your files in:")
             print("   - run\\input\\ directory (for batch processing)")
             print("   - Same directory as this executable")
             return
         
-        if os.path.exists(input_dir):
+        # Files were taken from run/input whenever it exists
+        used_batch_input = has_batch_input
+        
+        if has_batch_input:
             print(f"📂 Input directory: {input_dir}")
         else:
-            print(f"📂 Processing files from: {os.getcwd()}")
+            print(f"📂 Processing files from: {current_dir}")
     
     # Determine workflow and settings
     if m4a_only_flag or mp3_only_flag or both_flag or transcribe_flag:
@@ -1231,123 +2535,117 @@ def main():
     print()
     
     # Check Whisper availability if needed
-    if workflow_type in ["text-only", "audio-and-text"] and not WHISPER_AVAILABLE:
-        print("❌ Error: Whisper AI is not available.")
-        print("Please install with: pip install openai-whisper torch")
-        return
+    if workflow_type in TEXT_WORKFLOWS:
+        if not _import_whisper():
+            print("❌ Error: Whisper AI is not available.")
+            print("Please install with: pip install openai-whisper torch")
+            return
+        
+        # Load the model before the batch starts instead of during the first file
+        try:
+            converter.load_transcriber(compute_type)
+        except Exception as e:
+            print(f"❌ Error: Could not load the Whisper model: {e}")
+            return
+        print()
     
     # Process each file
     total_files = len(input_files)
     successful_conversions = 0
     failed_conversions = 0
-    start_time = time.time()
+    start_time = time.monotonic()  # Elapsed time only, immune to wall-clock changes
     
     if total_files > 1:
         print(f"🔄 Batch Processing: {total_files} files with same settings")
         print("=" * 50)
     
-    for i, input_file in enumerate(input_files, 1):
-        input_path = Path(input_file)
-        file_name = input_path.name
+    # Audio-only workflows are independent per file, so spread them over worker
+    # processes; transcription stays sequential (one Whisper model in memory)
+    if total_files > 1 and workflow_type in ["audio-only", "m4a-to-mp3"]:
+        max_workers = min(os.cpu_count() or 1, total_files)
+        print(f"⚡ Converting with {max_workers} parallel workers...")
+        print()
         
-        # Show batch progress with time estimates
-        if total_files > 1:
-            elapsed = time.time() - start_time
-            if i > 1:  # Can estimate time after first file
-                avg_time_per_file = elapsed / (i - 1)
-                remaining_files = total_files - i + 1
-                estimated_remaining = avg_time_per_file * remaining_files
-                eta_minutes = int(estimated_remaining / 60)
-                eta_seconds = int(estimated_remaining % 60)
-                print(f"📊 Batch Progress: [{i}/{total_files}] | ETA: {eta_minutes}m {eta_seconds}s")
-            else:
-                print(f"📊 Batch Progress: [{i}/{total_files}] | Calculating ETA...")
-        else:
-            print(f"[{i}/{total_files}]", end=" ")
-            
-        print(f"Processing: {file_name}")
-        print("-" * 50)
+        # Workers log through a queue; a single listener thread writes to stdout
+        log_queue = multiprocessing.Queue()
+        listener = logging.handlers.QueueListener(log_queue, log_handler)
+        listener.start()
         
         try:
-            audio_file = None  # Track intermediate audio file for text conversion
-            
-            # Determine file extension for processing logic
-            file_ext = input_path.suffix.lower()
-            
-            # Step 1: Audio conversion based on file type and workflow
-            if file_ext == '.mp4':
-                # MP4 file processing
-                if workflow_type in ["audio-only", "audio-and-text"]:
-                    if format_choice == "m4a":
-                        # Convert only to M4A
-                        audio_file = converter.mp4_to_m4a(input_file)
-                        print(f"✅ M4A conversion completed: {os.path.basename(audio_file)}")
-                        
-                    elif format_choice == "mp3":
-                        # Convert directly to MP3
-                        audio_file = converter.convert_mp4_to_mp3_direct(input_file)
-                        print(f"✅ MP3 conversion completed: {os.path.basename(audio_file)}")
-                        
-                    elif format_choice == "both":
-                        # Convert to both M4A and MP3
-                        m4a_file = converter.mp4_to_m4a(input_file)
-                        print(f"✅ M4A conversion completed: {os.path.basename(m4a_file)}")
-                        
-                        mp3_file = converter.convert_mp4_to_mp3_direct(input_file)
-                        print(f"✅ MP3 conversion completed: {os.path.basename(mp3_file)}")
-                        
-                        # Use M4A for text conversion (better quality)
-                        audio_file = m4a_file
-                        
-                        # Clean up intermediate M4A file if not requested to keep
-                        if not keep_intermediate and workflow_type == "audio-only":
-                            try:
-                                os.remove(m4a_file)
-                                print(f"🧹 Cleaned up intermediate file: {os.path.basename(m4a_file)}")
-                            except OSError as e:
-                                print(f"⚠ Warning: Could not remove {m4a_file}: {e}")
-                                
-            elif file_ext == '.m4a':
-                # M4A file processing
-                if workflow_type in ["m4a-to-mp3", "m4a-mp3-and-text"]:
-                    # Convert M4A to MP3
-                    audio_file = converter.m4a_to_mp3(input_file)
-                    print(f"✅ MP3 conversion completed: {os.path.basename(audio_file)}")
-                elif workflow_type == "text-only":
-                    # Use M4A file directly for transcription
-                    audio_file = input_file
-            
-            # Step 2: Text conversion (if needed)
-            if workflow_type in ["text-only", "audio-and-text", "m4a-mp3-and-text"]:
-                if workflow_type == "text-only" and file_ext == '.mp4':
-                    # Convert MP4 to audio first (use M4A for best quality)
-                    print(f"  🎵 Converting to audio for transcription...")
-                    audio_file = converter.mp4_to_m4a(input_file)
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                     initargs=(log_queue, converter.force)) as executor:
+                if format_choice == "mp3" and total_files > max_workers:
+                    # One FFmpeg process per worker shard amortizes FFmpeg start-up
+                    groups = [input_files[i::max_workers] for i in range(max_workers)]
+                    batched = True
+                else:
+                    groups = [[input_file] for input_file in input_files]
+                    batched = False
+                futures = [executor.submit(_process_files, group, workflow_type,
+                                           format_choice, keep_intermediate, batched)
+                           for group in groups]
                 
-                # Transcribe to text
-                print(f"  🤖 Starting AI transcription...")
-                text_file = converter.transcribe_audio_to_text(audio_file)
-                print(f"✅ Text transcription completed: {os.path.basename(text_file)}")
+                done = 0
+                for future in as_completed(futures):
+                    # One console write per finished group instead of one per line
+                    lines = []
+                    for success, file_name, error in future.result():
+                        done += 1
+                        if success:
+                            successful_conversions += 1
+                        else:
+                            failed_conversions += 1
+                            lines.append(f"❌ Error processing {file_name}: {error}")
+                        lines.append(f"📊 Batch Progress: [{done}/{total_files}] {file_name}")
+                    # Through the listener's handler, so it never splits a worker's line
+                    logger.info('\n'.join(lines))
+        finally:
+            listener.stop()
+        print()
+    elif total_files > 1 and workflow_type in ["audio-and-text", "m4a-mp3-and-text"]:
+        print(f"⚡ Converting the next file while the current one is transcribed...")
+        print()
+        
+        for done, (success, file_name, error) in enumerate(
+                _process_files_pipelined(input_files, workflow_type, format_choice,
+                                         keep_intermediate, converter), 1):
+            if success:
+                successful_conversions += 1
+            else:
+                failed_conversions += 1
+                print(f"❌ Error processing {file_name}: {error}")
+            print(f"📊 Batch Progress: [{done}/{total_files}] {file_name}")
+            print()
+    else:
+        for i, input_file in enumerate(input_files, 1):
+            file_name = Path(input_file).name
+            
+            # Show batch progress with time estimates
+            if total_files > 1:
+                if i > 1:  # Can estimate time after first file
+                    elapsed = time.monotonic() - start_time
+                    estimated_remaining = elapsed / (i - 1) * (total_files - i + 1)
+                    print(f"📊 Batch Progress: [{i}/{total_files}] | ETA: {_format_eta(estimated_remaining)}")
+                else:
+                    print(f"📊 Batch Progress: [{i}/{total_files}] | Calculating ETA...")
+            else:
+                print(f"[{i}/{total_files}]", end=" ")
                 
-                # Clean up temporary audio file for text-only workflow
-                if workflow_type == "text-only" and file_ext == '.mp4':
-                    try:
-                        os.remove(audio_file)
-                        print(f"🧹 Cleaned up temporary audio file: {os.path.basename(audio_file)}")
-                    except OSError as e:
-                        print(f"⚠ Warning: Could not remove temporary file: {e}")
+            print(f"Processing: {file_name}")
+            print("-" * 50)
             
-            successful_conversions += 1
-            print(f"🎉 Successfully processed: {file_name}")
+            success, file_name, error = _process_file(input_file, workflow_type, format_choice,
+                                                      keep_intermediate, converter)
+            if success:
+                successful_conversions += 1
+            else:
+                failed_conversions += 1
+                print(f"❌ Error processing {file_name}: {error}")
             
-        except Exception as e:
-            failed_conversions += 1
-            print(f"❌ Error processing {file_name}: {e}")
-        
-        print()
+            print()
     
     # Calculate total processing time
-    total_time = time.time() - start_time
+    total_time = time.monotonic() - start_time
     hours = int(total_time // 3600)
     minutes = int((total_time % 3600) // 60)
     seconds = int(total_time % 60)
@@ -1376,22 +2674,22 @@ def main():
         print(f"Average time per file:     {avg_minutes}m {avg_seconds}s")
     
     # Auto-move text files to output directory if using batch processing
-    input_dir = os.path.join(os.getcwd(), "run", "input")
     output_dir = os.path.join(os.getcwd(), "run", "output")
     
-    if (len(input_files) > 0 and 
-        os.path.exists(input_dir) and 
-        any(input_file.startswith(input_dir) for input_file in input_files) and
-        workflow_type in ["text-only", "audio-and-text"]):
+    if used_batch_input and workflow_type in ["text-only", "audio-and-text"]:
         
         # Move text files to output directory
-        os.makedirs(output_dir, exist_ok=True)
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
         moved_files = 0
         
-        for txt_file in glob.glob("*.txt"):
+        with os.scandir() as entries:
+            txt_files = [entry.name for entry in entries
+                         if entry.is_file() and entry.name.lower().endswith('.txt')]
+        
+        for txt_file in txt_files:
             try:
-                output_path = os.path.join(output_dir, txt_file)
-                os.rename(txt_file, output_path)
+                shutil.move(txt_file, output_path / txt_file)  # Falls back to copy + delete across drives
                 moved_files += 1
             except Exception as e:
                 print(f"⚠️ Could not move {txt_file} to output directory: {e}")
@@ -1412,88 +2710,23 @@ def main():
             print(f"✅ {successful_conversions} files were processed successfully.")
     
     # Show appropriate directory information
-    if (os.path.exists(output_dir) and 
+    if (used_batch_input and
         workflow_type in ["text-only", "audio-and-text"] and
-        any(input_file.startswith(input_dir) for input_file in input_files if os.path.exists(input_dir))):
+        os.path.exists(output_dir)):
         print(f"\n📁 Check your text files in: {output_dir}")
     else:
         print("\n📁 Check your files in the current directory.")
-        
-    print("\nPress Enter to exit...")
-    try:
-        input()
-    except KeyboardInterrupt:
-        pass
-    total_files = len(input_files)
-    successful_conversions = 0
-    failed_conversions = 0
     
-    for i, input_file in enumerate(input_files, 1):
-        input_path = Path(input_file)
-        file_name = input_path.name
-        
-        print(f"[{i}/{total_files}] Processing: {file_name}")
-        print("-" * 50)
-        
+    if not no_pause_flag and pause_on_exit():
+        print("\nPress Enter to exit...")
         try:
-            if format_choice == "m4a":
-                # Convert only to M4A
-                m4a_output = converter.mp4_to_m4a(input_file)
-                print(f"✅ M4A conversion completed: {os.path.basename(m4a_output)}")
-                
-            elif format_choice == "mp3":
-                # Convert directly to MP3
-                mp3_output = converter.convert_mp4_to_mp3_direct(input_file)
-                print(f"✅ MP3 conversion completed: {os.path.basename(mp3_output)}")
-                
-            elif format_choice == "both":
-                # Convert to both M4A and MP3
-                m4a_output = converter.mp4_to_m4a(input_file)
-                print(f"✅ M4A conversion completed: {os.path.basename(m4a_output)}")
-                
-                mp3_output = converter.m4a_to_mp3(m4a_output)
-                print(f"✅ MP3 conversion completed: {os.path.basename(mp3_output)}")
-                
-                # Clean up intermediate M4A file if not requested to keep
-                if not keep_intermediate:
-                    try:
-                        os.remove(m4a_output)
-                        print(f"🧹 Cleaned up intermediate file: {os.path.basename(m4a_output)}")
-                    except OSError as e:
-                        print(f"⚠ Warning: Could not remove {m4a_output}: {e}")
-            
-            successful_conversions += 1
-            print(f"🎉 Successfully processed: {file_name}")
-            
-        except Exception as e:
-            failed_conversions += 1
-            print(f"❌ Error processing {file_name}: {e}")
-        
-        print()
-    
-    # Print summary
-    print("=" * 60)
-    print("                    🎵 CONVERSION SUMMARY 🎵")
-    print("=" * 60)
-    print(f"Total files processed:     {total_files}")
-    print(f"Successful conversions:    {successful_conversions}")
-    print(f"Failed conversions:        {failed_conversions}")
-    
-    if failed_conversions == 0:
-        print("\n🎉 All conversions completed successfully!")
-        print("✨ Your audio files are ready to use!")
-    else:
-        print(f"\n⚠ {failed_conversions} conversion(s) failed. Check the error messages above.")
-    
-    print("\n📁 Check your files in the current directory.")
-    print("\nPress Enter to exit...")
-    try:
-        input()
-    except KeyboardInterrupt:
-        pass
+            input()
+        except (KeyboardInterrupt, EOFError):
+            pass
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     try:
         main()
     except KeyboardInterrupt:
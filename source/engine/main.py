@@ -7,179 +7,574 @@ This PoC processes all MP4 files in the current directory and converts them to M
 
 import os
 import sys
-import glob
+import argparse
+import logging
+import logging.handlers
+import multiprocessing
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 # Handle imports for both development and packaged executable
 try:
-    from converter import AudioConverter
+    from converter import AudioConverter, ProgressTracker, find_mp4_files, pause_on_exit, PYAV_AVAILABLE
 except ImportError:
     # Try importing from the same directory (for packaged executable)
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-    from converter import AudioConverter
+    from converter import AudioConverter, ProgressTracker, find_mp4_files, pause_on_exit, PYAV_AVAILABLE
 
 
-def find_mp4_files(directory: str = ".") -> list:
+# Worker processes send their records to the parent's listener, which is the
+# only writer to stdout
+logger = logging.getLogger('mp4conv')
+
+# Shared media-time counter (microseconds) for the batch-wide progress bar,
+# installed in each pool worker by _init_worker
+_progress_counter = None
+
+# Set by _init_worker: status lines go to the queue-forwarded logger, not stdout
+_in_worker = False
+
+# Auto-enable batched MP3 conversion for many small files, where FFmpeg
+# start-up cost is a large share of each conversion
+BATCH_AUTO_MIN_FILES = 8
+BATCH_AUTO_MAX_TOTAL_MB = 512
+
+# FFmpeg processes kept in flight by the M4A-only remux pipeline
+M4A_PIPELINE_DEPTH = 3
+
+# Parallel FFmpeg runs on a spinning disk turn seek-bound, so cap the workers
+HDD_MAX_WORKERS = 2
+
+
+def _is_rotational(device: int) -> bool:
+    """Check whether a block device is a spinning disk (Linux sysfs only)"""
+    if not sys.platform.startswith('linux'):
+        return False
+    
+    sys_path = os.path.realpath(f"/sys/dev/block/{os.major(device)}:{os.minor(device)}")
+    # Partitions keep their queue/ settings in the parent disk's directory
+    for candidate in (sys_path, os.path.dirname(sys_path)):
+        flag_file = os.path.join(candidate, 'queue', 'rotational')
+        if os.path.exists(flag_file):
+            with open(flag_file) as f:
+                return f.read().strip() == '1'
+    return False
+
+
+def _detect_storage_parallelism(paths: list) -> int:
+    """
+    Pick a worker count that suits the storage holding the input files
+    
+    Args:
+        paths (list): Input file paths
+    
+    Returns:
+        int: CPU count, or at most HDD_MAX_WORKERS if any input is on a spinning disk
+    """
+    cpu_count = os.cpu_count() or 1
+    try:
+        devices = {os.stat(path).st_dev for path in paths}
+        if any(_is_rotational(device) for device in devices):
+            return min(cpu_count, HDD_MAX_WORKERS)
+    except OSError:
+        pass
+    return cpu_count
+
+
+def _process_one(input_file: str, m4a_only: bool, mp3_only: bool, keep_intermediate: bool,
+                 threads: int = None, force: bool = False,
+                 mp3_quality: int = None, mp3_bitrate: str = None,
+                 backend: str = "ffmpeg") -> tuple:
     """
-    Find all MP4 files in the specified directory
+    Convert a single MP4 file (runs inside a worker process for batch runs)
     
     Args:
-        directory (str): Directory to search for MP4 files (defaults to current directory)
+        input_file (str): Path to the MP4 file
+        m4a_only (bool): Only convert to M4A format
+        mp3_only (bool): Only convert to MP3 format
+        keep_intermediate (bool): Keep the M4A file produced alongside the MP3
+        threads (int, optional): FFmpeg thread count for this conversion
+        force (bool): Convert even if the outputs are newer than the input
+        mp3_quality (int, optional): LAME VBR quality for the MP3 output
+        mp3_bitrate (str, optional): Constant MP3 bitrate, overrides mp3_quality
+        backend (str): "ffmpeg", or "pyav" to encode direct MP3 conversions in-process
     
     Returns:
-        list: List of MP4 file paths
+        tuple: (success, message) where message describes the error on failure
     """
-    patterns = ["*.mp4", "*.MP4"]
-    mp4_files = []
+    converter = AudioConverter(threads=threads, force=force, progress_counter=_progress_counter,
+                               mp3_quality=mp3_quality, mp3_bitrate=mp3_bitrate, log_status=_in_worker,
+                               backend=backend)
+    file_name = Path(input_file).name
     
-    for pattern in patterns:
-        search_path = os.path.join(directory, pattern)
-        mp4_files.extend(glob.glob(search_path))
+    # One log record for the header and one for the results keeps each file to
+    # two writes, whatever the workflow
+    logger.info(f"Processing: {file_name}\n{'-' * 50}")
     
-    return sorted(list(set(mp4_files)))  # Remove duplicates and sort
+    try:
+        if m4a_only:
+            # Convert only to M4A
+            outputs = [("M4A", converter.mp4_to_m4a(input_file))]
+            
+        elif mp3_only:
+            # Convert directly to MP3 (single pass)
+            outputs = [("MP3", converter.convert_mp4_to_mp3(input_file, keep_intermediate=keep_intermediate))]
+            
+        elif keep_intermediate:
+            # Convert to both M4A and MP3 with one FFmpeg process
+            m4a_output, mp3_output = converter.mp4_to_m4a_and_mp3(input_file)
+            outputs = [("M4A", m4a_output), ("MP3", mp3_output)]
+            
+        else:
+            # Default: the M4A would only be deleted again, so write the MP3 alone
+            outputs = [("MP3", converter.convert_mp4_to_mp3_direct(input_file))]
+        
+        logger.info("\n".join(f"✓ {label} conversion completed: {os.path.basename(output)}"
+                              for label, output in outputs))
+        
+        return True, file_name
+        
+    except Exception as e:
+        return False, str(e)
+
+
+def _process_batch(input_files: list, threads: int = None, force: bool = False,
+                   mp3_quality: int = None, mp3_bitrate: str = None,
+                   backend: str = "ffmpeg") -> list:
+    """
+    Convert a group of MP4 files to MP3 with one FFmpeg process (runs in a worker)
+    
+    Files that the batched command did not produce (including every file of a
+    failed batch) are retried one by one with the selected backend.
+    
+    Args:
+        input_files (list): Paths to the MP4 files in this group
+        threads (int, optional): FFmpeg thread count per output
+        force (bool): Convert even if the MP3 files are newer than the inputs
+        mp3_quality (int, optional): LAME VBR quality for the MP3 outputs
+        mp3_bitrate (str, optional): Constant MP3 bitrate, overrides mp3_quality
+        backend (str): Backend of the per-file retries; the batch itself always
+                       runs the FFmpeg executable
+    
+    Returns:
+        list: One (success, message) tuple per input file
+    """
+    converter = AudioConverter(threads=threads, force=force, progress_counter=_progress_counter,
+                               mp3_quality=mp3_quality, mp3_bitrate=mp3_bitrate, log_status=_in_worker,
+                               backend=backend)
+    logger.info(f"Batch converting {len(input_files)} files to MP3...")
+    created = set(converter.batch_to_mp3(input_files))
+    
+    results = []
+    for input_file in input_files:
+        input_path = Path(input_file)
+        mp3_path = input_path.with_suffix('.mp3')
+        if str(mp3_path) in created:
+            logger.info(f"✓ MP3 conversion completed: {mp3_path.name}")
+            results.append((True, input_path.name))
+        else:
+            results.append(_process_one(input_file, False, True, False, threads, force,
+                                        mp3_quality, mp3_bitrate, backend))
+    return results
+
+
+def _convert_m4a_pipelined(input_files: list, depth: int = M4A_PIPELINE_DEPTH,
+                           force: bool = False) -> list:
+    """
+    Remux MP4 files to M4A while keeping a few FFmpeg processes in flight
+    
+    Stream copy is I/O-bound, so worker processes are not needed: the next file's
+    probe and command setup simply run while earlier FFmpeg processes are writing.
+    
+    Args:
+        input_files (list): Paths to the MP4 files
+        depth (int): Maximum number of FFmpeg processes running at once
+        force (bool): Convert even if the M4A files are newer than the inputs
+    
+    Returns:
+        list: One (success, message) tuple per input file, in input order
+    """
+    converter = AudioConverter(threads=1, force=force)
+    converter.probe_many(input_files)  # Codec decisions below hit the cache
+    pending = deque()
+    by_file = {}
+    
+    def finish_oldest():
+        input_file, process, m4a_output = pending.popleft()
+        try:
+            converter.finish_m4a_async(process, m4a_output)
+            logger.info(f"✓ M4A conversion completed: {os.path.basename(m4a_output)}")
+            by_file[input_file] = (True, os.path.basename(input_file))
+        except RuntimeError as e:
+            by_file[input_file] = (False, str(e))
+    
+    for input_file in input_files:
+        if len(pending) >= depth:
+            finish_oldest()
+        try:
+            process, m4a_output = converter.mp4_to_m4a_async(input_file)
+            if process is None:
+                by_file[input_file] = (True, os.path.basename(input_file))
+            else:
+                pending.append((input_file, process, m4a_output))
+        except Exception as e:
+            by_file[input_file] = (False, str(e))
+    
+    while pending:
+        finish_oldest()
+    
+    return [by_file[f] for f in input_files]
+
+
+class _ProgressBarHandler(logging.StreamHandler):
+    """Stream handler that shares its terminal line with the batch progress bar
+    
+    While a bar is shown, every record first blanks the bar's line and the bar is
+    redrawn below the record, so log text never lands inside the bar and the bar
+    never overdraws log text. Drawing and logging take the handler's lock.
+    """
+    
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self.bar = None  # Text of the bar currently on screen
+    
+    def emit(self, record):
+        if self.bar is not None:
+            self.stream.write('\r' + ' ' * len(self.bar) + '\r')
+        super().emit(record)
+        if self.bar is not None:
+            self.stream.write(self.bar)
+            self.flush()
+    
+    def draw_bar(self, bar: str):
+        """Show bar on the current line, replacing the previous one"""
+        with self.lock:
+            self.bar = bar
+            self.stream.write('\r' + bar)
+            self.flush()
+    
+    def end_bar(self):
+        """Leave the last bar on screen and continue logging below it"""
+        with self.lock:
+            if self.bar is not None:
+                self.stream.write('\n')
+                self.flush()
+            self.bar = None
+
+
+def _setup_logging() -> logging.Handler:
+    """Send the converter log to stdout as plain lines and return the handler"""
+    handler = _ProgressBarHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.handlers[:] = [handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return handler
+
+
+def _available_cores() -> list:
+    """List the CPU cores this process is allowed to run on"""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _pin_worker(cores: list, core_slot):
+    """Pin the current worker (and the FFmpeg processes it starts) to one core
+    
+    Each worker takes the next slot from the shared core_slot counter. This is a
+    no-op on platforms without an affinity API.
+    """
+    with core_slot.get_lock():
+        index = core_slot.value
+        core_slot.value += 1
+    core = cores[index % len(cores)]
+    
+    try:
+        if hasattr(os, 'sched_setaffinity'):
+            os.sched_setaffinity(0, {core})
+        elif sys.platform == 'win32':
+            import ctypes
+            from ctypes import wintypes
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            # DWORD_PTR mask: without argtypes ctypes passes a 32-bit int and
+            # silently truncates the mask for cores 31 and up
+            kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+            kernel32.SetProcessAffinityMask.argtypes = [wintypes.HANDLE, ctypes.c_size_t]
+            kernel32.SetProcessAffinityMask.restype = wintypes.BOOL
+            if not kernel32.SetProcessAffinityMask(kernel32.GetCurrentProcess(), 1 << core):
+                logger.info(f"⚠ Could not pin worker to core {core} "
+                            f"(Windows error {ctypes.get_last_error()})")
+    except (OSError, AttributeError, ValueError):
+        pass
+
+
+def _init_worker(log_queue, progress_counter=None, cores=None, core_slot=None):
+    """Pool initializer: forward logs and progress to the parent and pin to a core"""
+    global _progress_counter, _in_worker
+    _progress_counter = progress_counter
+    _in_worker = True
+    logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    
+    if cores:
+        _pin_worker(cores, core_slot)
+
+
+def _show_batch_progress(progress_counter, total_seconds: float, done: threading.Event,
+                         handler: _ProgressBarHandler):
+    """Draw one progress bar for all workers until done is set
+    
+    The bar is drawn through the log handler so that log records from the
+    workers are written above it instead of into it.
+    """
+    bar = None
+    while not done.wait(0.5):
+        converted = progress_counter.value / 1_000_000
+        text = ProgressTracker.progress_bar_text(min(100, converted / total_seconds * 100))
+        if text != bar:
+            handler.draw_bar(text)
+            bar = text
+    handler.draw_bar(ProgressTracker.progress_bar_text(100))
+    handler.end_bar()
 
 
 def print_banner():
     """Print the application banner"""
-    print("=" * 60)
-    print("         MP4 to Audio Converter - PoC")
-    print("         Converting MP4 files to M4A and MP3")
-    print("=" * 60)
-    print()
+    logger.info("=" * 60)
+    logger.info("         MP4 to Audio Converter - PoC")
+    logger.info("         Converting MP4 files to M4A and MP3")
+    logger.info("=" * 60)
+    logger.info("")
 
 
 def print_help():
     """Print help information"""
-    print("Usage:")
-    print("  mp4_converter.exe                    - Convert all MP4 files in current directory")
-    print("  mp4_converter.exe <input_file>       - Convert specific MP4 file")
-    print("  mp4_converter.exe --help             - Show this help message")
-    print()
-    print("Options:")
-    print("  --keep-intermediate    Keep intermediate M4A files (default: delete them)")
-    print("  --m4a-only            Only convert to M4A format")
-    print("  --mp3-only            Only convert to MP3 format (via M4A)")
-    print()
+    logger.info("Usage:")
+    logger.info("  mp4_converter.exe                    - Convert all MP4 files in current directory")
+    logger.info("  mp4_converter.exe <input_file> ...   - Convert specific MP4 file(s)")
+    logger.info("  mp4_converter.exe --help             - Show this help message")
+    logger.info("")
+    logger.info("Options:")
+    logger.info("  --keep-intermediate    Keep intermediate M4A files (default: delete them)")
+    logger.info("  --m4a-only            Only convert to M4A format")
+    logger.info("  --mp3-only            Only convert to MP3 format (direct)")
+    logger.info("  --force               Convert even if the outputs are newer than the inputs")
+    logger.info("  --quality <0-9>       MP3 VBR quality, 0 = best (default: 2, about 190 kbps)")
+    logger.info("  --bitrate <rate>      Encode MP3 at a constant bitrate instead, e.g. 128k")
+    logger.info("  --batched             With --mp3-only, convert files in groups with one FFmpeg")
+    logger.info("                        process per group (automatic for many small files)")
+    logger.info("  --jobs <n>            Convert n files at a time (default: one per core, fewer")
+    logger.info("                        on a spinning disk)")
+    logger.info("  --pyav                Encode MP3 in-process with PyAV instead of starting")
+    logger.info("                        FFmpeg for each file (needs: pip install av)")
+    logger.info("  --no-pause            Exit without waiting for a key press at the end")
+    logger.info("")
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command line parser (help output is provided by print_help)"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('-h', '--help', action='store_true')
+    parser.add_argument('--keep-intermediate', action='store_true')
+    parser.add_argument('--m4a-only', action='store_true')
+    parser.add_argument('--mp3-only', action='store_true')
+    parser.add_argument('--batched', action='store_true')
+    parser.add_argument('--force', action='store_true')
+    parser.add_argument('--quality', type=int, choices=range(10))
+    parser.add_argument('--bitrate')
+    parser.add_argument('--jobs', type=int)
+    parser.add_argument('--pyav', action='store_true')
+    parser.add_argument('--no-pause', action='store_true')
+    parser.add_argument('inputs', nargs='*')
+    return parser
 
 
 def main():
     """Main function for the PoC CLI"""
+    log_handler = _setup_logging()
     print_banner()
     
     # Parse command line arguments
-    args = sys.argv[1:]
-    keep_intermediate = "--keep-intermediate" in args
-    m4a_only = "--m4a-only" in args
-    mp3_only = "--mp3-only" in args
-    
-    # Remove flags from args
-    args = [arg for arg in args if not arg.startswith("--")]
+    opts = build_arg_parser().parse_args()
+    keep_intermediate = opts.keep_intermediate
+    m4a_only = opts.m4a_only
+    mp3_only = opts.mp3_only
+    batched = opts.batched
+    force = opts.force
+    mp3_quality = opts.quality
+    mp3_bitrate = opts.bitrate
+    jobs = opts.jobs if opts.jobs and opts.jobs > 0 else None
+    backend = "pyav" if opts.pyav and PYAV_AVAILABLE else "ffmpeg"
     
     # Check for help
-    if "--help" in sys.argv or "-h" in sys.argv:
+    if opts.help:
         print_help()
         return
     
-    # Initialize converter
-    converter = AudioConverter()
+    if opts.pyav and not PYAV_AVAILABLE:
+        logger.info("⚠ PyAV is not installed (pip install av), converting with FFmpeg")
+        logger.info("")
     
     # Determine input files
-    if args:
-        # Specific file provided
-        input_files = [args[0]]
-        if not os.path.exists(args[0]):
-            print(f"Error: File '{args[0]}' not found!")
-            sys.exit(1)
+    if opts.inputs:
+        # Specific file(s) provided
+        input_files = opts.inputs
+        for input_file in input_files:
+            if not os.path.exists(input_file):
+                logger.info(f"Error: File '{input_file}' not found!")
+                sys.exit(1)
     else:
         # Process all MP4 files in current directory
         current_dir = os.getcwd()
         input_files = find_mp4_files(current_dir)
         
         if not input_files:
-            print("No MP4 files found in the current directory.")
-            print(f"Current directory: {current_dir}")
-            print("\nSupported file extensions: .mp4, .MP4")
+            logger.info("No MP4 files found in the current directory.")
+            logger.info(f"Current directory: {current_dir}")
+            logger.info("\nSupported file extensions: .mp4, .MP4")
             return
     
-    print(f"Found {len(input_files)} MP4 file(s) to process:")
-    for i, file in enumerate(input_files, 1):
-        print(f"  {i}. {os.path.basename(file)}")
-    print()
+    # Per-file listings go out as one log record each, so a large batch costs one
+    # stdout write and flush per block instead of one per line
+    lines = [f"Found {len(input_files)} MP4 file(s) to process:"]
+    lines += [f"  {i}. {os.path.basename(file)}" for i, file in enumerate(input_files, 1)]
+    logger.info("\n".join(lines) + "\n")
+    
+    # Preflight: report empty or non-regular inputs now instead of starting
+    # FFmpeg runs that can only fail
+    skipped_files = [f for f in input_files if not os.path.isfile(f) or os.path.getsize(f) == 0]
+    if skipped_files:
+        logger.info("\n".join(f"✗ Skipping {os.path.basename(input_file)}: empty or not a regular file"
+                              for input_file in skipped_files) + "\n")
+        skipped = set(skipped_files)
+        input_files = [f for f in input_files if f not in skipped]
     
-    # Process each file
+    # Process each file (in parallel worker processes for batches)
     total_files = len(input_files)
     successful_conversions = 0
-    failed_conversions = 0
+    failed_conversions = len(skipped_files)
     
-    for i, input_file in enumerate(input_files, 1):
-        input_path = Path(input_file)
-        file_name = input_path.name
+    if total_files == 0:
+        results = []
+    elif total_files == 1:
+        # A single file cannot use the pool, so let FFmpeg encode with every core
+        results = [_process_one(input_files[0], m4a_only, mp3_only, keep_intermediate,
+                                threads=os.cpu_count(), force=force,
+                                mp3_quality=mp3_quality, mp3_bitrate=mp3_bitrate,
+                                backend=backend)]
+    elif m4a_only:
+        # Remuxing is I/O-bound, overlap a few FFmpeg processes from this process
+        depth = jobs or min(M4A_PIPELINE_DEPTH, _detect_storage_parallelism(input_files))
+        logger.info(f"Remuxing {total_files} files to M4A ({depth} at a time)...")
+        logger.info("")
+        results = _convert_m4a_pipelined(input_files, depth, force)
+    else:
+        # FFmpeg threads per worker so the workers together use each core once
+        max_workers = min(total_files, jobs or _detect_storage_parallelism(input_files))
+        threads = max(1, (os.cpu_count() or 1) // max_workers)
+        
+        # Batch many small MP3-only jobs into one FFmpeg process per worker
+        if mp3_only and not keep_intermediate and not batched:
+            total_mb = sum(os.path.getsize(f) for f in input_files) / (1024 * 1024)
+            batched = total_files > BATCH_AUTO_MIN_FILES and total_mb < BATCH_AUTO_MAX_TOTAL_MB
+        use_batches = batched and mp3_only and not keep_intermediate
         
-        print(f"[{i}/{total_files}] Processing: {file_name}")
-        print("-" * 50)
+        logger.info(f"Processing {total_files} files with {max_workers} parallel workers...")
+        logger.info("")
+        
+        # Workers log through a queue; a single listener thread writes to stdout
+        log_queue = multiprocessing.Queue()
+        listener = logging.handlers.QueueListener(log_queue, log_handler)
+        listener.start()
+        
+        # Workers add their converted media time to a shared counter that drives
+        # one progress bar over the total duration of all inputs
+        tracker = ProgressTracker()
+        with ThreadPoolExecutor(max_workers=8) as probe_executor:
+            total_seconds = sum(probe_executor.map(tracker.get_video_duration, input_files))
+        progress_counter = multiprocessing.Value('q', 0)
+        progress_done = threading.Event()
+        progress_thread = None
+        # The bar redraws in place, which only makes sense on a terminal
+        if total_seconds > 0 and sys.stdout is not None and sys.stdout.isatty():
+            progress_thread = threading.Thread(target=_show_batch_progress, daemon=True,
+                                               args=(progress_counter, total_seconds, progress_done,
+                                                     log_handler))
+            progress_thread.start()
         
         try:
-            if m4a_only:
-                # Convert only to M4A
-                m4a_output = converter.mp4_to_m4a(input_file)
-                print(f"✓ M4A conversion completed: {os.path.basename(m4a_output)}")
-                
-            elif mp3_only:
-                # Convert directly to MP3 (via M4A)
-                mp3_output = converter.convert_mp4_to_mp3(input_file, keep_intermediate=keep_intermediate)
-                print(f"✓ MP3 conversion completed: {os.path.basename(mp3_output)}")
-                
-            else:
-                # Convert to both M4A and MP3 (default)
-                m4a_output = converter.mp4_to_m4a(input_file)
-                print(f"✓ M4A conversion completed: {os.path.basename(m4a_output)}")
-                
-                mp3_output = converter.m4a_to_mp3(m4a_output)
-                print(f"✓ MP3 conversion completed: {os.path.basename(mp3_output)}")
-                
-                # Clean up intermediate M4A file if not requested to keep
-                if not keep_intermediate:
-                    try:
-                        os.remove(m4a_output)
-                        print(f"✓ Cleaned up intermediate file: {os.path.basename(m4a_output)}")
-                    except OSError as e:
-                        print(f"⚠ Warning: Could not remove {m4a_output}: {e}")
-            
+            # Workers running single-threaded FFmpeg each get their own core
+            core_slot = multiprocessing.Value('i', 0)
+            cores = _available_cores() if threads == 1 else None
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                     initargs=(log_queue, progress_counter,
+                                               cores, core_slot)) as executor:
+                if use_batches:
+                    groups = [input_files[i::max_workers] for i in range(max_workers)]
+                    by_file = {}
+                    for group, group_results in zip(groups, executor.map(_process_batch, groups, repeat(threads), repeat(force),
+                                                                                    repeat(mp3_quality), repeat(mp3_bitrate),
+                                                                                    repeat(backend))):
+                        by_file.update(zip(group, group_results))
+                    results = [by_file[f] for f in input_files]
+                else:
+                    results = list(executor.map(_process_one, input_files,
+                                                repeat(m4a_only), repeat(mp3_only),
+                                                repeat(keep_intermediate), repeat(threads),
+                                                repeat(force), repeat(mp3_quality),
+                                                repeat(mp3_bitrate), repeat(backend)))
+        finally:
+            progress_done.set()
+            if progress_thread is not None:
+                progress_thread.join()
+            listener.stop()
+    
+    lines = []
+    for input_file, (ok, message) in zip(input_files, results):
+        file_name = os.path.basename(input_file)
+        if ok:
             successful_conversions += 1
-            print(f"✓ Successfully processed: {file_name}")
-            
-        except Exception as e:
+            lines.append(f"✓ Successfully processed: {file_name}")
+        else:
             failed_conversions += 1
-            print(f"✗ Error processing {file_name}: {e}")
-        
-        print()
+            lines.append(f"✗ Error processing {file_name}: {message}")
+    lines.append("")
+    logger.info("\n".join(lines))
     
     # Print summary
-    print("=" * 60)
-    print("                    CONVERSION SUMMARY")
-    print("=" * 60)
-    print(f"Total files processed:     {total_files}")
-    print(f"Successful conversions:    {successful_conversions}")
-    print(f"Failed conversions:        {failed_conversions}")
+    logger.info("=" * 60)
+    logger.info("                    CONVERSION SUMMARY")
+    logger.info("=" * 60)
+    logger.info(f"Total files processed:     {total_files + len(skipped_files)}")
+    logger.info(f"Successful conversions:    {successful_conversions}")
+    logger.info(f"Failed conversions:        {failed_conversions}")
     
     if failed_conversions == 0:
-        print("\n🎉 All conversions completed successfully!")
+        logger.info("\n🎉 All conversions completed successfully!")
     else:
-        print(f"\n⚠ {failed_conversions} conversion(s) failed. Check the error messages above.")
+        logger.info(f"\n⚠ {failed_conversions} conversion(s) failed. Check the error messages above.")
     
-    print("\nPress any key to exit...")
-    try:
-        input()
-    except KeyboardInterrupt:
-        pass
+    if not opts.no_pause and pause_on_exit():
+        logger.info("\nPress any key to exit...")
+        try:
+            input()
+        except (KeyboardInterrupt, EOFError):
+            pass
 
 
 if __name__ == "__main__":
+    # Required for worker processes in the packaged (PyInstaller) executable
+    multiprocessing.freeze_support()
     try:
         main()
     except KeyboardInterrupt:
-        print("\n\nOperation cancelled by user.")
+        logger.info("\n\nOperation cancelled by user.")
         sys.exit(1)
     except Exception as e:
-        print(f"\nUnexpected error: {e}")
+        logger.info(f"\nUnexpected error: {e}")
         sys.exit(1)
\ No newline at end of file
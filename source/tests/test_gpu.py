@@ -4,6 +4,12 @@
 import sys
 import os
 
+# Add the project root to the path so we can import the converter
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from source.engine.converter import pause_on_exit
+
 try:
     import torch
     print("=== PyTorch GPU Detection Test ===")
@@ -50,4 +56,8 @@ except ImportError as e:
     print("Install with: pip install torch torchaudio")
 
 print("\n" + "="*50)
-input("Press Enter to exit...")
\ No newline at end of file
+if pause_on_exit():
+    try:
+        input("Press Enter to exit...")
+    except (KeyboardInterrupt, EOFError):
+        pass
\ No newline at end of file
@@ -3,6 +3,13 @@
 
 import warnings
 import os
+import sys
+
+# Add the project root to the path so we can import the converter
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from source.engine.converter import pause_on_exit
 
 # Suppress Triton kernel warnings
 warnings.filterwarnings("ignore", message="Failed to launch Triton kernels")
@@ -51,4 +58,8 @@ except Exception as e:
     print(f"❌ Test failed: {e}")
 
 print("\n" + "="*50)
-input("Press Enter to exit...")
\ No newline at end of file
+if pause_on_exit():
+    try:
+        input("Press Enter to exit...")
+    except (KeyboardInterrupt, EOFError):
+        pass
\ No newline at end of file